@@ -0,0 +1,48 @@
+# Microbenchmark for extract_swot_components on large generated analyses.
+# Run from the repository root: python benchmarks/bench_parser.py
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from swot_analyzer.parsing import extract_swot_components  # noqa: E402
+
+
+# Build an analysis with items_per_section bullets (plus continuation lines) under each header
+def generate_analysis(items_per_section):
+    lines = []
+    for header in ("STRENGTHS", "WEAKNESSES", "OPPORTUNITIES", "THREATS"):
+        lines.append(f"## {header}")
+        lines.append("")
+        for i in range(items_per_section):
+            lines.append(f"- **{header.title()} item {i}:** A specific point with supporting detail.")
+            lines.append("  It continues on an indented line with examples and potential impact.")
+            lines.append("")
+        lines.append("---")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that SWOT parsing time scales linearly with input size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000],
+                        help="Items per section for each run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size; the fastest is reported")
+    args = parser.parse_args(argv)
+
+    print(f"{'items/section':>14} {'lines':>10} {'best (ms)':>10} {'ns/line':>9}")
+    for size in args.sizes:
+        text = generate_analysis(size)
+        line_count = text.count("\n") + 1
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            components = extract_swot_components(text)
+            best = min(best, time.perf_counter() - started)
+        assert all(len(items) == size for items in components.values())
+        print(f"{size:>14} {line_count:>10} {best * 1000:>10.1f} {best / line_count * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
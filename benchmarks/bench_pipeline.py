@@ -0,0 +1,194 @@
+# End-to-end benchmark of the analysis pipeline on the local fake backend.
+# Run from the repository root: python benchmarks/bench_pipeline.py [--check | --update-baseline]
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baselines.json")
+
+# Metrics where a larger value is better; every other metric regresses when it grows
+HIGHER_IS_BETTER_PREFIX = "throughput_"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SWOT pipeline end to end against the fake backend.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake model seconds before the first token")
+    parser.add_argument("--tokens-per-second", type=float, default=5000.0, help="Fake model token rate")
+    parser.add_argument("--long-documents", type=int, default=2, help="Synthetic long documents added to the input set")
+    parser.add_argument("--long-document-chars", type=int, default=30000, help="Size of each synthetic long document")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes over the input set for per-stage latency")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="Concurrency levels for the throughput runs")
+    parser.add_argument("--requests", type=int, default=32, help="Analyses per throughput run")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative regression before --check fails")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero when a metric regresses past the baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run's results as the new baseline")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    return parser.parse_args(argv)
+
+
+# The pipeline reads its settings at import time, so configure the environment first
+def configure_environment(args, cache_dir):
+    os.environ["SWOT_BACKEND"] = "fake"
+    os.environ["SWOT_CACHE_DIR"] = cache_dir
+    os.environ["SWOT_FAKE_LATENCY"] = str(args.latency)
+    os.environ["SWOT_FAKE_TOKENS_PER_SECOND"] = str(args.tokens_per_second)
+    os.environ["SWOT_CORPUS_POLL_SECONDS"] = "0"
+    os.environ["SWOT_RESPONSE_CACHE_DB"] = ""
+    for name in ("SWOT_INDEX_DIR", "SWOT_EMBEDDING_CACHE_DIR", "SWOT_QUADRANTS", "SWOT_OUTPUT_MODE"):
+        os.environ.pop(name, None)
+
+
+# Long inputs stitched from shuffled sample paragraphs, so the map-reduce path is exercised too
+def synthetic_long_documents(samples, count, chars):
+    paragraphs = [paragraph.strip() for text in samples for paragraph in text.split("\n\n") if paragraph.strip()]
+    documents = []
+    for seed in range(count):
+        rng = random.Random(seed)
+        parts, size = [], 0
+        while size < chars:
+            paragraph = rng.choice(paragraphs)
+            parts.append(paragraph)
+            size += len(paragraph) + 2
+        documents.append("\n\n".join(parts))
+    return documents
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_once(org_info, qa_chain):
+    from swot_analyzer.charts import create_swot_bar_chart, create_swot_visualization
+    from swot_analyzer.parsing import extract_swot_components
+    from swot_analyzer.pipeline import generate_swot_analysis
+
+    timings = {}
+    started = time.perf_counter()
+    analysis = generate_swot_analysis(org_info, qa_chain)
+    timings["generate"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    components = extract_swot_components(analysis)
+    timings["parse"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    create_swot_visualization(components)
+    create_swot_bar_chart(components)
+    timings["charts"] = time.perf_counter() - started
+    return timings
+
+
+def measure_throughput(inputs, qa_chain, concurrency, requests):
+    workload = [inputs[i % len(inputs)] for i in range(requests)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda org_info: run_once(org_info, qa_chain), workload))
+    return requests / (time.perf_counter() - started)
+
+
+def run_benchmark(args):
+    from swot_analyzer.metrics import METRICS
+    from swot_analyzer.pipeline import initialize_rag
+    from swot_analyzer.samples import SAMPLE_ORGS
+
+    results = {}
+
+    # Cold start builds the index and embeds the corpus; warm start loads both from disk
+    started = time.perf_counter()
+    initialize_rag()
+    results["cold_start_s"] = time.perf_counter() - started
+    started = time.perf_counter()
+    qa_chain = initialize_rag()
+    results["warm_start_s"] = time.perf_counter() - started
+
+    inputs = list(SAMPLE_ORGS.values())
+    inputs += synthetic_long_documents(inputs, args.long_documents, args.long_document_chars)
+
+    stage_samples = {}
+    for _ in range(args.repeat):
+        for org_info in inputs:
+            for stage, seconds in run_once(org_info, qa_chain).items():
+                stage_samples.setdefault(stage, []).append(seconds)
+    for stage, samples in stage_samples.items():
+        results[f"{stage}_p50_s"] = statistics.median(samples)
+    # Inner stages (embedding, vector search, generation, ...) as recorded by the pipeline's own hooks
+    for row in METRICS.stage_summary():
+        results[f"stage_{row['stage']}_p50_s"] = row["p50_s"]
+        results[f"stage_{row['stage']}_p95_s"] = row["p95_s"]
+
+    for concurrency in args.concurrency:
+        results[f"throughput_c{concurrency}_per_s"] = measure_throughput(inputs, qa_chain, concurrency, args.requests)
+
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+# Metrics that regressed past tolerance, as "name: value vs baseline" lines
+def find_regressions(results, baseline, tolerance):
+    regressions = []
+    for name, expected in baseline.items():
+        actual = results.get(name)
+        if actual is None or not expected:
+            continue
+        if name.startswith(HIGHER_IS_BETTER_PREFIX):
+            regressed = actual < expected * (1 - tolerance)
+        else:
+            regressed = actual > expected * (1 + tolerance)
+        if regressed:
+            regressions.append(f"{name}: {actual:.4g} vs baseline {expected:.4g}")
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="swot-bench-") as cache_dir:
+        configure_environment(args, cache_dir)
+        results = run_benchmark(args)
+
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:>10.4f}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if args.check:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --update-baseline first", file=sys.stderr)
+            return 2
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Regressed beyond {args.tolerance:.0%} of baseline:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Core building blocks for the SWOT Analysis WebAPP (RAG index, caching, pipeline helpers)
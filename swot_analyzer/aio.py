@@ -0,0 +1,36 @@
+import asyncio
+import threading
+
+_shared_loop = None
+_shared_loop_lock = threading.Lock()
+
+
+# Event loop running forever on a daemon thread, shared by every session in the process.
+# Loop-bound async clients (such as the Gemini gRPC channel) are created once on it and
+# reused, so concurrent analyses multiplex over pooled connections instead of threads.
+class BackgroundLoop:
+    def __init__(self, name="swot-async-loop"):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    # Schedule a coroutine on the loop; returns a concurrent.futures.Future
+    def submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+
+def get_shared_loop():
+    global _shared_loop
+    with _shared_loop_lock:
+        if _shared_loop is None:
+            _shared_loop = BackgroundLoop()
+        return _shared_loop
+
+
+# Run a coroutine on the shared loop and block the calling thread until it finishes
+def run_on_shared_loop(coro, timeout=None):
+    return get_shared_loop().submit(coro).result(timeout)
@@ -0,0 +1,270 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+
+from swot_analyzer.backends import requires_api_key
+from swot_analyzer.cache import ResponseCache, normalize_text
+from swot_analyzer.config import (
+    API_CONCURRENCY,
+    API_MAX_BATCH,
+    API_MAX_BODY_BYTES,
+    API_MAX_QUEUE,
+    MAX_INPUT_BYTES,
+    OUTPUT_MODE,
+    RESPONSE_CACHE_DB,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+)
+from swot_analyzer.metrics import METRICS
+from swot_analyzer.parsing import extract_swot_components
+from swot_analyzer.quality import QUALITY_LEVELS, requested_quality
+
+logger = logging.getLogger(__name__)
+
+# Seconds a client is asked to wait after a 429
+RETRY_AFTER_SECONDS = 5
+
+
+class QueueFull(Exception):
+    pass
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# Shared analysis runner: identical in-flight requests share one task, and at most
+# concurrency + max_queue distinct analyses are admitted at a time
+class AnalysisService:
+    def __init__(self, qa_chain, cache=None, concurrency=API_CONCURRENCY, max_queue=API_MAX_QUEUE):
+        self.qa_chain = qa_chain
+        self.cache = cache
+        self.capacity = concurrency + max_queue
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._inflight = {}  # Coalescing key -> asyncio.Task
+
+    # Requests differing only in whitespace are the same analysis
+    def _key(self, org_info, quality):
+        return quality, normalize_text(org_info)
+
+    def pending(self):
+        return len(self._inflight)
+
+    # Distinct new analyses that (org_info, quality) requests would add to the queue
+    def new_work(self, requests):
+        return len({self._key(org_info, quality) for org_info, quality in requests} - set(self._inflight))
+
+    async def _run(self, org_info, quality):
+        from swot_analyzer.pipeline import MODEL_ID, agenerate_swot_analysis, generate_structured_swot
+        from swot_analyzer.structured import render_swot_markdown, swot_components_from_structured
+
+        # The quality level reaches the model router through a context variable local to this task
+        async with self._semaphore:
+            started = time.perf_counter()
+            with requested_quality(quality):
+                if OUTPUT_MODE == "json":
+                    swot = await asyncio.to_thread(generate_structured_swot, org_info, self.qa_chain, self.cache)
+                    analysis, swot_components = render_swot_markdown(swot), swot_components_from_structured(swot)
+                else:
+                    analysis = await agenerate_swot_analysis(org_info, self.qa_chain, cache=self.cache)
+                    swot_components = extract_swot_components(analysis)
+            return {
+                "model": MODEL_ID,
+                "quality": quality,
+                "elapsed_seconds": round(time.perf_counter() - started, 3),
+                "analysis": analysis,
+                "swot_components": swot_components,
+            }
+
+    # Result for org_info and whether it was shared with an identical request already in flight
+    async def analyze(self, org_info, quality="auto"):
+        key = self._key(org_info, quality)
+        task = self._inflight.get(key)
+        coalesced = task is not None
+        if coalesced:
+            METRICS.increment("api_coalesced")
+        else:
+            if len(self._inflight) >= self.capacity:
+                raise QueueFull()
+            task = asyncio.ensure_future(self._run(org_info, quality))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded, so a client that disconnects doesn't cancel the analysis others are waiting on
+        return await asyncio.shield(task), coalesced
+
+
+def _org_info(payload, where="request"):
+    org_info = payload.get("org_info") if isinstance(payload, dict) else None
+    if not isinstance(org_info, str) or not org_info.strip():
+        raise HttpError(400, f"{where} needs a non-empty 'org_info' string")
+    if len(org_info.encode("utf-8")) > MAX_INPUT_BYTES:
+        raise HttpError(413, f"{where} 'org_info' exceeds {MAX_INPUT_BYTES} bytes")
+    return org_info
+
+
+def _quality(payload, where="request"):
+    quality = payload.get("quality", "auto")
+    if quality not in QUALITY_LEVELS:
+        raise HttpError(400, f"{where} 'quality' must be one of {', '.join(QUALITY_LEVELS)}")
+    return quality
+
+
+# ASGI application: POST /v1/analyze, POST /v1/analyze/batch, GET /healthz, GET /metrics
+class SwotApi:
+    def __init__(self, concurrency=API_CONCURRENCY, max_queue=API_MAX_QUEUE):
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.service = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as exc:
+                    logger.exception("API startup failed")
+                    await send({"type": "lifespan.startup.failed", "message": str(exc)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def startup(self):
+        from swot_analyzer.pipeline import initialize_rag
+
+        qa_chain = await asyncio.to_thread(initialize_rag)
+        cache = ResponseCache(
+            max_entries=RESPONSE_CACHE_SIZE,
+            ttl_seconds=RESPONSE_CACHE_TTL,
+            db_path=RESPONSE_CACHE_DB or None
+        )
+        self.service = AnalysisService(qa_chain, cache, self.concurrency, self.max_queue)
+        logger.info("SWOT API ready (%d concurrent analyses, %d queued)", self.concurrency, self.max_queue)
+
+    async def _http(self, scope, receive, send):
+        route = (scope["method"], scope["path"].rstrip("/") or "/")
+        try:
+            if route == ("GET", "/healthz"):
+                ready = self.service is not None
+                status, body = (200 if ready else 503), {"ready": ready, "pending": self.service.pending() if ready else 0}
+            elif route == ("GET", "/metrics"):
+                await self._send(send, 200, METRICS.render_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+                return
+            elif route == ("POST", "/v1/analyze"):
+                status, body = 200, await self._analyze(await self._json_body(receive))
+            elif route == ("POST", "/v1/analyze/batch"):
+                status, body = 200, await self._analyze_batch(await self._json_body(receive))
+            else:
+                raise HttpError(404, "Not found")
+        except QueueFull:
+            METRICS.increment("api_requests", status=429)
+            await self._send_json(send, 429, {"error": "Analysis queue is full; retry later"},
+                                  [(b"retry-after", str(RETRY_AFTER_SECONDS).encode())])
+            return
+        except HttpError as exc:
+            status, body = exc.status, {"error": str(exc)}
+        except Exception as exc:
+            logger.exception("Analysis failed")
+            status, body = 502, {"error": f"Analysis failed: {exc}"}
+        METRICS.increment("api_requests", status=status)
+        await self._send_json(send, status, body)
+
+    def _require_service(self):
+        if self.service is None:
+            raise HttpError(503, "Service is starting")
+        return self.service
+
+    async def _analyze(self, payload):
+        service = self._require_service()
+        result, coalesced = await service.analyze(_org_info(payload), _quality(payload))
+        return {**result, "coalesced": coalesced}
+
+    # Admitted all-or-nothing, so a batch is never left half queued
+    async def _analyze_batch(self, payload):
+        service = self._require_service()
+        items = payload.get("organizations") if isinstance(payload, dict) else None
+        if not isinstance(items, list) or not items:
+            raise HttpError(400, "request needs a non-empty 'organizations' list")
+        if len(items) > API_MAX_BATCH:
+            raise HttpError(413, f"batch exceeds {API_MAX_BATCH} organizations")
+        requests = [(_org_info(item, f"organizations[{i}]"), _quality(item, f"organizations[{i}]"))
+                    for i, item in enumerate(items)]
+        if service.pending() + service.new_work(requests) > service.capacity:
+            raise QueueFull()
+
+        outcomes = await asyncio.gather(*(service.analyze(*request) for request in requests), return_exceptions=True)
+        results = []
+        for i, (item, outcome) in enumerate(zip(items, outcomes)):
+            org_id = str(item.get("id") if item.get("id") is not None else i + 1)
+            if isinstance(outcome, BaseException):
+                results.append({"id": org_id, "error": str(outcome) or type(outcome).__name__})
+            else:
+                result, coalesced = outcome
+                results.append({"id": org_id, **result, "coalesced": coalesced})
+        return {"results": results}
+
+    async def _json_body(self, receive):
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > API_MAX_BODY_BYTES:
+                raise HttpError(413, f"Request body exceeds {API_MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        try:
+            return json.loads(b"".join(chunks) or b"{}")
+        except ValueError as exc:
+            raise HttpError(400, f"Invalid JSON: {exc}") from exc
+
+    async def _send_json(self, send, status, body, headers=()):
+        await self._send(send, status, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json", headers)
+
+    async def _send(self, send, status, body, content_type, headers=()):
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type.encode()), (b"content-length", str(len(body)).encode()), *headers],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+# Module-level app for ASGI servers: uvicorn swot_analyzer.api:app
+app = SwotApi()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the SWOT pipeline over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--concurrency", type=int, default=API_CONCURRENCY, help="Analyses running at once")
+    parser.add_argument("--max-queue", type=int, default=API_MAX_QUEUE, help="Analyses waiting before requests get 429")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if requires_api_key() and not os.environ.get("GOOGLE_API_KEY"):
+        parser.error("GOOGLE_API_KEY must be set to serve the API (or use SWOT_BACKEND=fake)")
+    try:
+        import uvicorn
+    except ImportError:
+        parser.error("The API server needs uvicorn: pip install uvicorn")
+    uvicorn.run(SwotApi(args.concurrency, args.max_queue), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
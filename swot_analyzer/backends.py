@@ -0,0 +1,59 @@
+from swot_analyzer.config import (
+    EMBEDDING_MODEL,
+    FAKE_LLM_LATENCY,
+    FAKE_LLM_TOKENS_PER_SECOND,
+    LLM_BACKEND,
+)
+
+BACKENDS = ("google", "fake")
+
+# Name used for the fake backend's embeddings in index fingerprints and cache keys
+FAKE_EMBEDDING_MODEL = "fake/hashing-768"
+
+
+def _check_backend():
+    if LLM_BACKEND not in BACKENDS:
+        raise ValueError(f"Unknown SWOT_BACKEND {LLM_BACKEND!r}; expected one of {', '.join(BACKENDS)}")
+
+
+# Whether the configured backend needs GOOGLE_API_KEY
+def requires_api_key():
+    return LLM_BACKEND == "google"
+
+
+# Embedding model name for the configured backend
+def embedding_model_name():
+    _check_backend()
+    return EMBEDDING_MODEL if LLM_BACKEND == "google" else FAKE_EMBEDDING_MODEL
+
+
+# Create the embedding model for the configured backend
+def create_embeddings():
+    _check_backend()
+    if LLM_BACKEND == "fake":
+        from swot_analyzer.fakes import HashingEmbeddings
+        return HashingEmbeddings()
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+    return GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL)
+
+
+# Create a chat model for the configured backend, wrapped with timeouts, retries, hedging and a circuit
+# breaker (callbacks fire once per call, chain or direct, however many attempts it takes)
+def create_chat_model(model, temperature, max_tokens, callbacks=None):
+    _check_backend()
+    from swot_analyzer.resilience import ResilientChatModel
+    if LLM_BACKEND == "fake":
+        from swot_analyzer.fakes import FakeSwotChatModel
+        llm = FakeSwotChatModel(
+            model=f"fake/{model}",
+            latency=FAKE_LLM_LATENCY,
+            tokens_per_second=FAKE_LLM_TOKENS_PER_SECOND
+        )
+    else:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        llm = ChatGoogleGenerativeAI(
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+    return ResilientChatModel(llm=llm, callbacks=callbacks)
@@ -0,0 +1,180 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from swot_analyzer.backends import requires_api_key
+from swot_analyzer.config import BREAKER_RESET_SECONDS, OUTPUT_MODE
+from swot_analyzer.parsing import extract_swot_components
+from swot_analyzer.pipeline import MODEL_ID, generate_structured_swot, generate_swot_analysis, initialize_rag
+from swot_analyzer.resilience import CircuitOpenError
+from swot_analyzer.structured import StructuredOutputError, render_swot_markdown, swot_components_from_structured
+
+logger = logging.getLogger(__name__)
+
+# Input columns/keys accepted for the organization description
+TEXT_FIELDS = ("org_info", "description", "text")
+
+
+# Errors worth retrying: provider rate limits, transient server failures and an open circuit breaker
+def _retryable_errors():
+    try:
+        from google.api_core import exceptions as google_exceptions
+    except ImportError:
+        return (ConnectionError, TimeoutError, CircuitOpenError)
+    return (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.TooManyRequests,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+        google_exceptions.InternalServerError,
+        ConnectionError,
+        TimeoutError,
+        CircuitOpenError,
+    )
+
+
+# Read organizations from a CSV or JSONL file as (id, org_info) pairs
+def read_organizations(path):
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+    organizations, first_row = [], {}
+    for number, row in enumerate(rows, start=1):
+        text = next((row[field] for field in TEXT_FIELDS if row.get(field)), None)
+        if not text:
+            logger.warning("Skipping row %d: no %s field", number, "/".join(TEXT_FIELDS))
+            continue
+        # A missing or blank id (csv gives "" for an empty cell) falls back to the row number; 0 is a real id
+        org_id = row.get("id")
+        org_id = str(number) if org_id is None or not str(org_id).strip() else str(org_id)
+        # Ids are the resume checkpoint, so a repeated id would silently skip rows on the next run
+        if org_id in first_row:
+            raise ValueError(f"{path}: id {org_id!r} of row {number} repeats row {first_row[org_id]}")
+        first_row[org_id] = number
+        organizations.append((org_id, text))
+    return organizations
+
+
+# Ids already written to the output file by a previous (possibly interrupted) run
+def completed_ids(output_path):
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                done.add(json.loads(line)["id"])
+            except (ValueError, KeyError):
+                # A crash can leave a truncated last line; that row is simply redone
+                continue
+    return done
+
+
+# Analysis markdown and components for one organization, in the configured output mode
+def _analyze(org_info, qa_chain):
+    if OUTPUT_MODE == "json":
+        swot = generate_structured_swot(org_info, qa_chain)
+        return render_swot_markdown(swot), swot_components_from_structured(swot)
+    analysis = generate_swot_analysis(org_info, qa_chain)
+    return analysis, extract_swot_components(analysis)
+
+
+# Run one analysis, retrying rate-limit, transient and malformed-output errors with exponential backoff
+def analyze_with_retries(org_info, qa_chain, max_retries=5, base_delay=2.0, max_delay=60.0):
+    retryable = _retryable_errors() + (StructuredOutputError,)
+    attempt = 0
+    while True:
+        try:
+            return _analyze(org_info, qa_chain)
+        except retryable as exc:
+            attempt += 1
+            if attempt > max_retries:
+                raise
+            delay = min(max_delay, base_delay * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+            if isinstance(exc, CircuitOpenError):
+                # Wait out the breaker's reset period; the jitter spreads the workers' retries after its probe
+                delay = max(delay, BREAKER_RESET_SECONDS * random.uniform(1.0, 1.5))
+            logger.warning("Attempt %d failed (%s); retrying in %.1fs", attempt, exc, delay)
+            time.sleep(delay)
+
+
+# Analyze every organization in input_path, appending JSONL results to output_path
+def run_batch(input_path, output_path, concurrency=4, max_retries=5, qa_chain=None):
+    organizations = read_organizations(input_path)
+    done = completed_ids(output_path)
+    pending = [(org_id, text) for org_id, text in organizations if org_id not in done]
+    logger.info("%d organizations, %d already done, %d to analyze", len(organizations), len(done), len(pending))
+    if not pending:
+        return {"succeeded": 0, "failed": 0, "skipped": len(done)}
+
+    qa_chain = qa_chain or initialize_rag()
+    write_lock = threading.Lock()
+    failures_path = output_path + ".failed.jsonl"
+    succeeded = failed = 0
+
+    def analyze(org_id, text):
+        started = time.perf_counter()
+        analysis, swot_components = analyze_with_retries(text, qa_chain, max_retries=max_retries)
+        return {
+            "id": org_id,
+            "model": MODEL_ID,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "analysis": analysis,
+            "swot_components": swot_components,
+        }
+
+    # Each finished row is flushed immediately so the output doubles as the checkpoint
+    with open(output_path, "a", encoding="utf-8") as out, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(analyze, org_id, text): org_id for org_id, text in pending}
+        for future in as_completed(futures):
+            org_id = futures[future]
+            try:
+                record = future.result()
+            except Exception as exc:
+                failed += 1
+                logger.error("Organization %s failed: %s", org_id, exc)
+                with write_lock, open(failures_path, "a", encoding="utf-8") as failures:
+                    failures.write(json.dumps({"id": org_id, "error": str(exc)}) + "\n")
+                continue
+            with write_lock:
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                os.fsync(out.fileno())
+            succeeded += 1
+            logger.info("Organization %s done in %.1fs (%d/%d)", org_id, record["elapsed_seconds"], succeeded + failed, len(pending))
+
+    return {"succeeded": succeeded, "failed": failed, "skipped": len(done)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run SWOT analyses for many organizations from a CSV or JSONL file.")
+    parser.add_argument("input", help="CSV or JSONL file with an org_info/description/text field and an optional id")
+    parser.add_argument("output", help="JSONL file for results; re-running resumes after the last completed row")
+    parser.add_argument("--concurrency", type=int, default=4, help="Number of analyses in flight at once")
+    parser.add_argument("--max-retries", type=int, default=5, help="Retries per organization on rate-limit or transient errors")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    if requires_api_key() and not os.environ.get("GOOGLE_API_KEY"):
+        parser.error("GOOGLE_API_KEY must be set for batch runs (or use SWOT_BACKEND=fake)")
+
+    try:
+        summary = run_batch(args.input, args.output, concurrency=args.concurrency, max_retries=args.max_retries)
+    except ValueError as exc:
+        parser.error(str(exc))
+    logger.info("Batch finished: %s", summary)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
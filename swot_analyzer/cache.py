@@ -0,0 +1,111 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from swot_analyzer.metrics import METRICS
+
+
+# Collapse whitespace so re-pasted or re-indented text maps to the same entry
+def normalize_text(text):
+    return " ".join(text.split())
+
+
+# Build a content-addressed key from everything that influences the model output
+def make_cache_key(org_info, prompt_template, model_name, temperature):
+    digest = hashlib.sha256()
+    for part in (normalize_text(org_info), prompt_template, model_name, repr(float(temperature))):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+# Two-tier response cache: in-memory LRU in front of an optional SQLite store
+class ResponseCache:
+    def __init__(self, max_entries=256, ttl_seconds=24 * 3600, db_path=None, db_max_entries=10000):
+        self.max_entries = max_entries
+        self.db_max_entries = db_max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if db_path:
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS responses_created ON responses (created)")
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=5)
+
+    def _expired(self, created):
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    def _remember(self, key, value, created):
+        self._entries[key] = (value, created)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1]):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    METRICS.increment("cache_requests", cache="response", result="memory_hit")
+                    return entry[0]
+                del self._entries[key]
+
+            if self.db_path:
+                with self._connect() as conn:
+                    row = conn.execute(
+                        "SELECT value, created FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row is not None and self._expired(row[1]):
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        row = None
+                if row is not None:
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    METRICS.increment("cache_requests", cache="response", result="disk_hit")
+                    return row[0]
+
+            self.misses += 1
+            METRICS.increment("cache_requests", cache="response", result="miss")
+            return None
+
+    def set(self, key, value):
+        created = time.time()
+        with self._lock:
+            self._remember(key, value, created)
+            if self.db_path:
+                with self._connect() as conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                        (key, value, created),
+                    )
+                    # Keep only the newest db_max_entries rows
+                    conn.execute(
+                        "DELETE FROM responses WHERE key IN ("
+                        "SELECT key FROM responses ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                        (self.db_max_entries,),
+                    )
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,58 @@
+import threading
+import time
+
+from langchain.callbacks.base import BaseCallbackHandler
+
+from swot_analyzer.metrics import METRICS, estimate_tokens
+
+
+# LangChain callback that forwards retriever/LLM events of a chain run to a StageTracker
+class StageCallbackHandler(BaseCallbackHandler):
+    def __init__(self, tracker):
+        self.tracker = tracker
+
+    def on_retriever_end(self, documents, **kwargs):
+        self.tracker.mark("retrieval")
+
+    def on_llm_new_token(self, token, **kwargs):
+        self.tracker.mark("first_token")
+
+    def on_llm_end(self, response, **kwargs):
+        self.tracker.mark("llm_complete")
+
+
+# LangChain callback attached to the chat model: records generation time, token counts and errors for every call
+class MetricsCallbackHandler(BaseCallbackHandler):
+    def __init__(self, registry=METRICS):
+        self.registry = registry
+        self._runs = {}  # run_id -> (start time, estimated prompt tokens)
+        self._lock = threading.Lock()
+
+    def _start(self, run_id, prompt_text):
+        with self._lock:
+            self._runs[run_id] = (time.perf_counter(), estimate_tokens(prompt_text))
+
+    def _finish(self, run_id):
+        with self._lock:
+            return self._runs.pop(run_id, (None, 0))
+
+    def on_llm_start(self, serialized, prompts, *, run_id, **kwargs):
+        self._start(run_id, "".join(prompts))
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, **kwargs):
+        self._start(run_id, "".join(str(message.content) for batch in messages for message in batch))
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        started, prompt_estimate = self._finish(run_id)
+        if started is not None:
+            self.registry.observe("llm_generation", time.perf_counter() - started)
+        # Prefer the provider's usage numbers; fall back to estimates from the text
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        completion = "".join(generation.text for generations in response.generations for generation in generations)
+        self.registry.increment("tokens", usage.get("prompt_tokens", prompt_estimate), kind="prompt")
+        self.registry.increment("tokens", usage.get("completion_tokens", estimate_tokens(completion)), kind="completion")
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        started, _ = self._finish(run_id)
+        if started is not None:
+            self.registry.observe("llm_generation", time.perf_counter() - started, error=True)
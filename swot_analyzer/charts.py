@@ -0,0 +1,98 @@
+import functools
+
+from swot_analyzer.config import FIGURE_CACHE_SIZE
+from swot_analyzer.parsing import SECTION_ORDER
+
+
+# Function to create visualization for SWOT analysis
+def create_swot_visualization(swot_components):
+    return _radar_figure(swot_counts(swot_components))
+
+
+# Function to create bar chart for SWOT components
+def create_swot_bar_chart(swot_components):
+    return _bar_figure(swot_counts(swot_components))
+
+
+# (label, item count) per component: the charts depend on nothing else, so this is the memoization key
+def swot_counts(swot_components):
+    return tuple((section.title(), len(swot_components[section])) for section in SECTION_ORDER)
+
+
+# Figures are memoized per counts and shared between reruns and sessions, so callers must not modify them
+@functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _radar_figure(count_items):
+    import plotly.graph_objects as go  # Deferred until the first chart is drawn
+    
+    counts = dict(count_items)
+    
+    # Create radar chart
+    categories = list(counts.keys())
+    values = list(counts.values())
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        name='SWOT Components',
+        line_color='#4b6cb7',
+        fillcolor='rgba(75, 108, 183, 0.3)'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, max(values) + 2]
+            )
+        ),
+        showlegend=False,
+        title="SWOT Analysis Overview",
+        title_font_size=20,
+        height=450,
+        width=450,
+        margin=dict(l=80, r=80, t=100, b=80)
+    )
+    
+    return fig
+
+@functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def _bar_figure(count_items):
+    import plotly.graph_objects as go
+    
+    counts = dict(count_items)
+    
+    # Define colors for each category
+    colors = {
+        "Strengths": "#4CAF50",
+        "Weaknesses": "#F44336",
+        "Opportunities": "#2196F3",
+        "Threats": "#FF9800"
+    }
+    
+    # Create bar chart
+    fig = go.Figure()
+    
+    for category, count in counts.items():
+        fig.add_trace(go.Bar(
+            x=[category],
+            y=[count],
+            name=category,
+            marker_color=colors[category],
+            text=[count],
+            textposition='auto'
+        ))
+    
+    fig.update_layout(
+        title="SWOT Components Distribution",
+        title_font_size=20,
+        height=450,
+        width=450,
+        margin=dict(l=50, r=50, t=100, b=50),
+        yaxis=dict(title='Number of Items'),
+        showlegend=False
+    )
+    
+    return fig
@@ -0,0 +1,114 @@
+import os
+
+# Root directory for locally persisted artifacts (vector index, caches)
+CACHE_DIR = os.environ.get("SWOT_CACHE_DIR", ".swot_cache")
+
+# Directory holding the persisted FAISS index for the SWOT concept corpus
+INDEX_DIR = os.environ.get("SWOT_INDEX_DIR", os.path.join(CACHE_DIR, "index"))
+
+# Embedding model used to vectorize the SWOT concept documents
+EMBEDDING_MODEL = os.environ.get("SWOT_EMBEDDING_MODEL", "models/embedding-001")
+
+# Shared response cache for generated analyses (set SWOT_RESPONSE_CACHE_DB="" to keep it in memory only)
+RESPONSE_CACHE_SIZE = int(os.environ.get("SWOT_RESPONSE_CACHE_SIZE", "256"))
+RESPONSE_CACHE_TTL = float(os.environ.get("SWOT_RESPONSE_CACHE_TTL", str(24 * 3600)))
+RESPONSE_CACHE_DB = os.environ.get("SWOT_RESPONSE_CACHE_DB", os.path.join(CACHE_DIR, "responses.sqlite3"))
+
+# Stream tokens into the result tabs while the analysis is generated
+STREAM_RESPONSES = os.environ.get("SWOT_STREAMING", "1") == "1"
+
+# Run non-streaming generations on the shared asyncio loop instead of the session's script thread
+ASYNC_GENERATION = os.environ.get("SWOT_ASYNC", "1") == "1"
+
+# Budget for text extracted from uploaded documents (UTF-8 bytes and PDF pages)
+MAX_INPUT_BYTES = int(os.environ.get("SWOT_MAX_INPUT_BYTES", str(64 * 1024)))
+MAX_INPUT_PAGES = int(os.environ.get("SWOT_MAX_INPUT_PAGES", "40"))
+
+# Inputs longer than this many characters are analyzed map-reduce style in parallel chunks
+LONG_DOCUMENT_CHARS = int(os.environ.get("SWOT_LONG_DOCUMENT_CHARS", "12000"))
+LONG_DOCUMENT_CHUNK_CHARS = int(os.environ.get("SWOT_LONG_DOCUMENT_CHUNK_CHARS", "6000"))
+LONG_DOCUMENT_CONCURRENCY = int(os.environ.get("SWOT_LONG_DOCUMENT_CONCURRENCY", "4"))
+
+# Persistent cache of query/document embeddings (one float32 vector file per embedding model)
+EMBEDDING_CACHE_DIR = os.environ.get("SWOT_EMBEDDING_CACHE_DIR", os.path.join(CACHE_DIR, "embeddings"))
+
+# Model backend: "google" (Gemini via API key) or "fake" (local deterministic stand-ins for offline benchmarking)
+LLM_BACKEND = os.environ.get("SWOT_BACKEND", "google")
+FAKE_LLM_LATENCY = float(os.environ.get("SWOT_FAKE_LATENCY", "0.5"))
+FAKE_LLM_TOKENS_PER_SECOND = float(os.environ.get("SWOT_FAKE_TOKENS_PER_SECOND", "200"))
+
+# Model output format: "markdown" (parsed heuristically) or "json" (schema-validated, rendered to markdown)
+OUTPUT_MODE = os.environ.get("SWOT_OUTPUT_MODE", "markdown")
+
+# Generate the four SWOT quadrants as concurrent, smaller LLM calls instead of one large call
+QUADRANT_GENERATION = os.environ.get("SWOT_QUADRANTS", "0") == "1"
+
+# Concept documents retrieved per analysis, and per-category k for category-filtered searches
+# (SWOT_CATEGORY_K="strengths=4,methodology=0" overrides individual categories)
+RETRIEVAL_K = int(os.environ.get("SWOT_RETRIEVAL_K", "7"))
+CATEGORY_K = {"default": 3, "methodology": 1}
+CATEGORY_K.update(
+    (name.strip(), int(value))
+    for name, value in (item.split("=", 1) for item in os.environ.get("SWOT_CATEGORY_K", "").split(",") if "=" in item)
+)
+
+# Knowledge corpus: a JSONL file or a directory of .jsonl/.txt/.md passages, re-checked for changes every
+# SWOT_CORPUS_POLL_SECONDS (0 disables hot reload)
+CORPUS_PATH = os.environ.get("SWOT_CORPUS_PATH", os.path.join(os.path.dirname(__file__), "data", "swot_concepts.jsonl"))
+CORPUS_POLL_SECONDS = float(os.environ.get("SWOT_CORPUS_POLL_SECONDS", "30"))
+
+# Corpus partitions with at least this many passages use an IVF index (searching SWOT_ANN_NPROBE lists) instead of exact search
+ANN_INDEX_THRESHOLD = int(os.environ.get("SWOT_ANN_THRESHOLD", "10000"))
+ANN_NPROBE = int(os.environ.get("SWOT_ANN_NPROBE", "16"))
+
+# Passages embedded per request when (re)building the index
+EMBEDDING_BATCH_SIZE = int(os.environ.get("SWOT_EMBEDDING_BATCH_SIZE", "100"))
+
+# Pipeline metrics: recent samples kept per stage for p50/p95, optional JSONL trace file,
+# optional Prometheus /metrics port (0 disables) and sidebar admin panel
+METRICS_WINDOW = int(os.environ.get("SWOT_METRICS_WINDOW", "1000"))
+METRICS_TRACE_PATH = os.environ.get("SWOT_METRICS_TRACE", "")
+METRICS_PORT = int(os.environ.get("SWOT_METRICS_PORT", "0"))
+ADMIN_PANEL = os.environ.get("SWOT_ADMIN_PANEL", "0") == "1"
+
+# Distinct chart figures kept in memory (figures depend only on the four item counts)
+FIGURE_CACHE_SIZE = int(os.environ.get("SWOT_FIGURE_CACHE_SIZE", "128"))
+
+# REST API: analyses running at once, distinct analyses allowed to wait before requests get 429,
+# organizations per batch request and request body size
+API_CONCURRENCY = int(os.environ.get("SWOT_API_CONCURRENCY", "8"))
+API_MAX_QUEUE = int(os.environ.get("SWOT_API_MAX_QUEUE", "32"))
+API_MAX_BATCH = int(os.environ.get("SWOT_API_MAX_BATCH", "50"))
+API_MAX_BODY_BYTES = int(os.environ.get("SWOT_API_MAX_BODY_BYTES", str(4 * 1024 * 1024)))
+
+# Near-duplicate result cache: inputs whose embedding is within this cosine similarity of an earlier one
+# reuse its analysis (set SWOT_SEMANTIC_CACHE=0 to disable)
+SEMANTIC_CACHE = os.environ.get("SWOT_SEMANTIC_CACHE", "1") == "1"
+SEMANTIC_CACHE_THRESHOLD = float(os.environ.get("SWOT_SEMANTIC_CACHE_THRESHOLD", "0.98"))
+SEMANTIC_CACHE_SIZE = int(os.environ.get("SWOT_SEMANTIC_CACHE_SIZE", "1024"))
+
+# Process-wide scheduler for the Streamlit app: analyses running at once across all sessions, and the
+# LLM request rate (requests per minute, 0 disables) and burst matched to the provider quota
+SCHEDULER_CONCURRENCY = int(os.environ.get("SWOT_SCHEDULER_CONCURRENCY", "4"))
+SCHEDULER_RPM = float(os.environ.get("SWOT_SCHEDULER_RPM", "60"))
+SCHEDULER_BURST = int(os.environ.get("SWOT_SCHEDULER_BURST", "10"))
+
+# Resilient LLM calls: timeout per attempt and overall deadline (seconds), retries on transient errors with
+# exponential backoff from SWOT_LLM_BACKOFF seconds, optional hedging once a call runs past this latency
+# quantile (e.g. 0.95; 0 disables), and a circuit breaker opening after this many consecutive failures
+LLM_TIMEOUT = float(os.environ.get("SWOT_LLM_TIMEOUT", "90"))
+LLM_DEADLINE = float(os.environ.get("SWOT_LLM_DEADLINE", "240"))
+LLM_MAX_RETRIES = int(os.environ.get("SWOT_LLM_RETRIES", "2"))
+LLM_RETRY_BACKOFF = float(os.environ.get("SWOT_LLM_BACKOFF", "1.0"))
+LLM_HEDGE_QUANTILE = float(os.environ.get("SWOT_LLM_HEDGE_QUANTILE", "0"))
+BREAKER_FAILURES = int(os.environ.get("SWOT_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.environ.get("SWOT_BREAKER_RESET_SECONDS", "30"))
+
+# Model routing: under the "auto" quality, prompts up to SWOT_FAST_MAX_PROMPT_CHARS characters (template and
+# retrieved context included) go to the cheaper SWOT_FAST_MODEL. A route whose recent error rate or p95 latency
+# (seconds) exceeds these limits is skipped while another is healthy. SWOT_ROUTING=0 sends everything to Gemini Pro.
+MODEL_ROUTING = os.environ.get("SWOT_ROUTING", "1") == "1"
+FAST_MODEL = os.environ.get("SWOT_FAST_MODEL", "gemini-1.5-flash-latest")
+FAST_MAX_PROMPT_CHARS = int(os.environ.get("SWOT_FAST_MAX_PROMPT_CHARS", "8000"))
+ROUTE_MAX_ERROR_RATE = float(os.environ.get("SWOT_ROUTE_MAX_ERROR_RATE", "0.25"))
+ROUTE_MAX_P95_SECONDS = float(os.environ.get("SWOT_ROUTE_MAX_P95", "60"))
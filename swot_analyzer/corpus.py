@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import re
+
+from swot_analyzer.config import CORPUS_PATH
+
+DEFAULT_CATEGORY = "general"
+TEXT_SUFFIXES = (".txt", ".md")
+JSONL_SUFFIX = ".jsonl"
+
+
+# Corpus files under path (a single file or a directory tree), in a stable order
+def corpus_files(path):
+    if os.path.isfile(path):
+        return [path]
+    files = []
+    for root, dirs, names in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        files.extend(os.path.join(root, name) for name in sorted(names)
+                     if name.endswith(TEXT_SUFFIXES + (JSONL_SUFFIX,)))
+    return files
+
+
+# Cheap change detector: hash of every corpus file's path, size and mtime
+def corpus_signature(path=CORPUS_PATH):
+    digest = hashlib.sha256()
+    for file_path in corpus_files(path):
+        stat = os.stat(file_path)
+        digest.update(f"{file_path}\x00{stat.st_size}\x00{stat.st_mtime_ns}\x00".encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Category for a file: its top-level subdirectory under the corpus root
+def _directory_category(root, file_path):
+    relative = os.path.relpath(file_path, root)
+    parts = relative.split(os.sep)
+    return parts[0].lower() if len(parts) > 1 else DEFAULT_CATEGORY
+
+
+def _read_jsonl(file_path, category):
+    with open(file_path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"{file_path}:{line_number}: invalid JSON ({exc})") from exc
+            text = str(record.get("text", "")).strip()
+            if text:
+                yield str(record.get("category") or category).lower(), text
+
+
+# Passages of a text or markdown file are its blank-line separated paragraphs
+def _read_text(file_path, category):
+    with open(file_path, encoding="utf-8") as f:
+        for paragraph in re.split(r"\n\s*\n", f.read()):
+            paragraph = " ".join(paragraph.split())
+            if paragraph:
+                yield category, paragraph
+
+
+# Load {category: [passage, ...]} from a JSONL file or a directory of .jsonl/.txt/.md files.
+# JSONL records are {"text": ..., "category": ...}; otherwise the category is the top-level subdirectory.
+def load_corpus(path=CORPUS_PATH):
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Corpus not found: {path}")
+    root = path if os.path.isdir(path) else os.path.dirname(path)
+    corpus = {}
+    for file_path in corpus_files(path):
+        category = _directory_category(root, file_path) if os.path.isdir(path) else DEFAULT_CATEGORY
+        reader = _read_jsonl if file_path.endswith(JSONL_SUFFIX) else _read_text
+        for passage_category, text in reader(file_path, category):
+            corpus.setdefault(passage_category, []).append(text)
+    # Repeated passages would only crowd out other results, so keep the first of each
+    return {category: list(dict.fromkeys(texts)) for category, texts in corpus.items()}
@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+from langchain.embeddings.base import Embeddings
+
+from swot_analyzer.metrics import METRICS, timed
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+VECTORS_FILE = "vectors.f32"
+KEYS_FILE = "keys.txt"
+META_FILE = "meta.json"
+
+
+# Append-only float32 vector file with a "key row" offset index, memory-mapped for reads
+class EmbeddingStore:
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.vectors_path = os.path.join(directory, VECTORS_FILE)
+        self.keys_path = os.path.join(directory, KEYS_FILE)
+        self.meta_path = os.path.join(directory, META_FILE)
+        self.dim = None
+        self._rows = {}
+        self._row_keys = {}  # Row -> key, to spot rows reused after a torn write was truncated away
+        self._keys_offset = 0
+        self._mmap = None
+        self._lock = threading.Lock()
+        with self._lock:
+            self._refresh()
+
+    # Pick up rows appended since the last refresh (possibly by another process)
+    def _refresh(self):
+        if self.dim is None and os.path.exists(self.meta_path):
+            with open(self.meta_path) as f:
+                self.dim = json.load(f)["dim"]
+        if not os.path.exists(self.keys_path):
+            return
+        with open(self.keys_path, "rb") as f:
+            f.seek(self._keys_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partially written line; read it next time
+                self._keys_offset += len(line)
+                fields = line.decode("ascii", "replace").split()
+                if len(fields) != 2 or not fields[1].isdigit():
+                    continue  # Damaged entry (e.g. a cut-off line a later write ran into); its key is re-embedded
+                self._assign(fields[0], int(fields[1]))
+
+    # Drop a trailing line cut off by a crash, so the next entry isn't appended onto it; callers hold the flock
+    def _truncate_partial_line(self, keys_file):
+        size = os.fstat(keys_file.fileno()).st_size
+        end = size
+        with open(self.keys_path, "rb") as f:
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+        if end < size:
+            keys_file.truncate(end)
+
+    # A later entry for a row wins: an earlier key on that row pointed at a vector that was truncated away
+    def _assign(self, key, row):
+        previous = self._row_keys.get(row)
+        if previous is not None and previous != key:
+            self._rows.pop(previous, None)
+        self._rows[key] = row
+        self._row_keys[row] = key
+
+    # Rows fully written to the vectors file; a trailing partial row (crash, full disk) doesn't count
+    def _complete_rows(self):
+        if self.dim is None or not os.path.exists(self.vectors_path):
+            return 0
+        return os.path.getsize(self.vectors_path) // (4 * self.dim)
+
+    # Stored vector at row, or None if the row isn't completely on disk
+    def _vector(self, row):
+        if self._mmap is None or row >= self._mmap.shape[0]:
+            rows = self._complete_rows()
+            if row >= rows:
+                return None
+            self._mmap = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim))
+        return self._mmap[row]
+
+    # Zero-copy view of the stored vector for key, or None
+    def get(self, key):
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None:
+                self._refresh()
+                row = self._rows.get(key)
+            return None if row is None else self._vector(row)
+
+    def put_many(self, items):
+        with self._lock, open(self.keys_path, "ab") as keys_file:
+            if fcntl is not None:
+                fcntl.flock(keys_file, fcntl.LOCK_EX)
+            try:
+                self._truncate_partial_line(keys_file)
+                self._refresh()
+                with open(self.vectors_path, "ab") as vectors_file:
+                    row = None
+                    for key, vector in items:
+                        if key in self._rows and self._vector(self._rows[key]) is not None:
+                            continue
+                        vector = np.asarray(vector, dtype=np.float32)
+                        if self.dim is None:
+                            self.dim = int(vector.shape[0])
+                            with open(self.meta_path, "w") as f:
+                                json.dump({"dim": self.dim}, f)
+                        if row is None:
+                            # Drop a partial trailing row left by a crash or full disk, so every row stays aligned
+                            row = self._complete_rows()
+                            vectors_file.truncate(row * 4 * self.dim)
+                            vectors_file.seek(0, os.SEEK_END)
+                        vectors_file.write(vector.tobytes())
+                        vectors_file.flush()
+                        keys_file.write(f"{key} {row}\n".encode("ascii"))
+                        keys_file.flush()
+                        self._keys_offset += len(f"{key} {row}\n")
+                        self._assign(key, row)
+                        row += 1
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(keys_file, fcntl.LOCK_UN)
+
+
+# Embeddings wrapper that serves repeat texts from an EmbeddingStore instead of the network
+class CachedEmbeddings(Embeddings):
+    def __init__(self, embeddings, store, model_name):
+        self.embeddings = embeddings
+        self.store = store
+        self.model_name = model_name
+
+    # Queries and documents are embedded with different task types, so they are keyed separately
+    def _key(self, kind, text):
+        return hashlib.sha256(f"{kind}\x00{self.model_name}\x00{text}".encode("utf-8")).hexdigest()
+
+    def embed_query(self, text):
+        key = self._key("query", text)
+        vector = self.store.get(key)
+        METRICS.increment("cache_requests", cache="embedding", result="miss" if vector is None else "hit")
+        if vector is None:
+            with timed("embedding"):
+                vector = self.embeddings.embed_query(text)
+            self.store.put_many([(key, vector)])
+        return vector
+
+    def embed_documents(self, texts):
+        keys = [self._key("document", text) for text in texts]
+        vectors = [self.store.get(key) for key in keys]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        METRICS.increment("cache_requests", len(texts) - len(missing), cache="embedding", result="hit")
+        METRICS.increment("cache_requests", len(missing), cache="embedding", result="miss")
+        if missing:
+            with timed("embedding"):
+                fresh = self.embeddings.embed_documents([texts[i] for i in missing])
+            self.store.put_many([(keys[i], vector) for i, vector in zip(missing, fresh)])
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+        return vectors
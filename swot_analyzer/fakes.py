@@ -0,0 +1,164 @@
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+
+import numpy as np
+from langchain.chat_models.base import BaseChatModel
+from langchain.embeddings.base import Embeddings
+from langchain.schema import AIMessage, ChatGeneration, ChatResult
+from langchain.schema.messages import AIMessageChunk
+from langchain.schema.output import ChatGenerationChunk
+
+# Building blocks for plausible SWOT items, per section
+_ITEM_TITLES = {
+    "STRENGTHS": [
+        "Proprietary Technology Platform", "Highly Skilled Workforce", "Strong Brand Reputation",
+        "Efficient Operational Processes", "Loyal Customer Base", "Healthy Cash Position",
+        "Data-Driven Decision Making", "Agile Product Development", "Strategic Partnerships",
+        "Scalable Infrastructure",
+    ],
+    "WEAKNESSES": [
+        "Legacy System Dependencies", "Limited Marketing Budget", "High Customer Acquisition Cost",
+        "Siloed Internal Communication", "Talent Retention Risk", "Single-Source Supplier Exposure",
+        "Long Sales Cycles", "Inconsistent Quality Control", "Narrow Product Portfolio",
+        "Aging Facilities",
+    ],
+    "OPPORTUNITIES": [
+        "International Market Expansion", "AI-Driven Automation", "Subscription Revenue Models",
+        "Partnerships with Startups", "Sustainability-Focused Offerings", "Adjacent Market Diversification",
+        "Regulatory Tailwinds", "Strategic Acquisitions", "Direct-to-Customer Channels",
+        "Data Monetization",
+    ],
+    "THREATS": [
+        "Aggressive Incumbent Competitors", "New Low-Cost Entrants", "Tightening Regulation",
+        "Supply Chain Disruptions", "Cybersecurity Incidents", "Economic Downturn",
+        "Rapid Technological Obsolescence", "Talent Shortages", "Shifting Customer Preferences",
+        "Rising Input Costs",
+    ],
+}
+
+_SENTENCES = [
+    "This directly affects the organization's ability to compete in its core markets.",
+    "Recent results suggest the effect is measurable in both revenue and operating margin.",
+    "Leadership attention and targeted investment over the next 12-18 months will determine the impact.",
+    "Peers that have addressed this well report faster growth and better customer retention.",
+    "The factor interacts with several others in this analysis and should be planned for jointly.",
+    "Quantifying it with a small set of KPIs would make progress visible to the board.",
+    "Left unmanaged, the effect compounds as the organization scales.",
+    "It is closely tied to the organization's current strategic priorities.",
+]
+
+_TOKEN = re.compile(r"\S+\s*|\s+")
+_QUADRANT_REQUEST = re.compile(r"analyze only the (STRENGTHS|WEAKNESSES|OPPORTUNITIES|THREATS)")
+
+
+# Deterministic SWOT markdown for a prompt (same prompt, same text); quadrant prompts get bare bullets
+def fake_swot_markdown(prompt, items_per_section=(6, 8)):
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+    quadrant = _QUADRANT_REQUEST.search(prompt)
+    lines = []
+    for section, titles in _ITEM_TITLES.items():
+        if quadrant and section != quadrant.group(1):
+            continue
+        if not quadrant:
+            lines.append(f"## {section}")
+            lines.append("")
+        for title in rng.sample(titles, rng.randint(*items_per_section)):
+            explanation = " ".join(rng.sample(_SENTENCES, rng.randint(2, 3)))
+            lines.append(f"- **{title}:** {explanation}")
+        lines.append("")
+    return "\n".join(lines)
+
+
+# Deterministic JSON in the structured output mode's schema (just the requested quadrant's array for
+# per-quadrant prompts)
+def fake_swot_json(prompt, items_per_section=(6, 8)):
+    rng = random.Random(hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+    quadrant = _QUADRANT_REQUEST.search(prompt)
+    data = {}
+    for section, titles in _ITEM_TITLES.items():
+        if quadrant and section != quadrant.group(1):
+            continue
+        data[section.lower()] = [
+            {
+                "title": title,
+                "explanation": " ".join(rng.sample(_SENTENCES, rng.randint(2, 3))),
+                "impact": rng.choice(("High", "Medium", "Low")),
+                "likelihood": rng.choice(("High", "Medium", "Low")),
+            }
+            for title in rng.sample(titles, rng.randint(*items_per_section))
+        ]
+    return json.dumps(next(iter(data.values())) if quadrant else data, indent=2)
+
+
+# Local stand-in for ChatGoogleGenerativeAI with configurable latency and token rate
+class FakeSwotChatModel(BaseChatModel):
+    model: str = "fake-swot"
+    latency: float = 0.5  # Seconds before the first token
+    tokens_per_second: float = 200.0
+
+    @property
+    def _llm_type(self):
+        return "fake-swot"
+
+    def _prompt_text(self, messages):
+        return "\n".join(str(message.content) for message in messages)
+
+    def _tokens(self, messages):
+        prompt = self._prompt_text(messages)
+        # Answer in JSON when the prompt comes from the structured output mode
+        text = fake_swot_json(prompt) if "Respond with only a JSON" in prompt else fake_swot_markdown(prompt)
+        return _TOKEN.findall(text)
+
+    def _token_delay(self):
+        return 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        tokens = self._tokens(messages)
+        time.sleep(self.latency + len(tokens) * self._token_delay())
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(tokens)))])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        tokens = self._tokens(messages)
+        await asyncio.sleep(self.latency + len(tokens) * self._token_delay())
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="".join(tokens)))])
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        time.sleep(self.latency)
+        for token in self._tokens(messages):
+            time.sleep(self._token_delay())
+            if run_manager is not None:
+                run_manager.on_llm_new_token(token)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        for token in self._tokens(messages):
+            await asyncio.sleep(self._token_delay())
+            if run_manager is not None:
+                await run_manager.on_llm_new_token(token)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+# Feature-hashing embeddings: deterministic, offline, and good enough for keyword-level retrieval
+class HashingEmbeddings(Embeddings):
+    def __init__(self, dim=768):
+        self.dim = dim
+
+    def _embed(self, text):
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dim
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
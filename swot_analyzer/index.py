@@ -0,0 +1,111 @@
+import hashlib
+import json
+import math
+import os
+import pickle
+import shutil
+import tempfile
+
+import faiss
+import numpy as np
+from langchain.docstore.document import Document
+from langchain.docstore.in_memory import InMemoryDocstore
+from langchain.vectorstores import FAISS
+
+from swot_analyzer.config import ANN_INDEX_THRESHOLD, ANN_NPROBE, EMBEDDING_BATCH_SIZE, INDEX_DIR
+
+INDEX_FILE = "index.faiss"
+DOCSTORE_FILE = "index.pkl"
+MANIFEST_FILE = "manifest.json"
+
+
+# Compute a stable fingerprint of the corpus (texts and their metadata) and the embedding model
+def corpus_fingerprint(texts, model_name, metadatas=None):
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    for text in texts:
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+    if metadatas is not None:
+        digest.update(b"\x01")
+        digest.update(json.dumps(metadatas, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Load the FAISS store from disk, memory-mapping the vector index
+def _load_index(index_path, embeddings):
+    index = faiss.read_index(os.path.join(index_path, INDEX_FILE), faiss.IO_FLAG_MMAP)
+    if isinstance(index, faiss.IndexIVF):
+        index.nprobe = ANN_NPROBE
+    with open(os.path.join(index_path, DOCSTORE_FILE), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
+
+
+# Embed texts in batches; each batch lands in the embedding cache, so an interrupted build resumes where it stopped
+def _embed_texts(texts, embeddings, batch_size=EMBEDDING_BATCH_SIZE):
+    batches = [
+        np.asarray(embeddings.embed_documents(texts[start:start + batch_size]), dtype=np.float32)
+        for start in range(0, len(texts), batch_size)
+    ]
+    return np.vstack(batches)
+
+
+# Exact search for small corpora; an IVF index (about 4*sqrt(n) lists) once the corpus passes ANN_INDEX_THRESHOLD
+def _vector_index(vectors):
+    dim = vectors.shape[1]
+    if len(vectors) < ANN_INDEX_THRESHOLD:
+        index = faiss.IndexFlatL2(dim)
+    else:
+        quantizer = faiss.IndexFlatL2(dim)
+        index = faiss.IndexIVFFlat(quantizer, dim, int(4 * math.sqrt(len(vectors))))
+        index.train(vectors)
+        index.nprobe = ANN_NPROBE
+    index.add(vectors)
+    return index
+
+
+# Embed the corpus and persist it atomically under index_path
+def _build_index(texts, embeddings, model_name, index_path, metadatas=None):
+    index = _vector_index(_embed_texts(texts, embeddings))
+    metadatas = metadatas or [{} for _ in texts]
+    docstore = InMemoryDocstore({
+        str(i): Document(page_content=text, metadata=metadata)
+        for i, (text, metadata) in enumerate(zip(texts, metadatas))
+    })
+    faiss_store = FAISS(embeddings, index, docstore, {i: str(i) for i in range(len(texts))})
+
+    parent = os.path.dirname(index_path)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=parent, prefix=".build-")
+    try:
+        faiss_store.save_local(staging)
+        with open(os.path.join(staging, MANIFEST_FILE), "w") as f:
+            json.dump({"model": model_name, "documents": len(texts), "index": type(index).__name__}, f)
+        os.replace(staging, index_path)
+    except OSError:
+        # Another process may have published the same index first
+        shutil.rmtree(staging, ignore_errors=True)
+        if not os.path.exists(os.path.join(index_path, MANIFEST_FILE)):
+            raise
+    return faiss_store
+
+
+# Return a FAISS store for texts, reusing the on-disk copy when the corpus and model are unchanged
+def load_or_build_index(texts, embeddings, model_name, index_dir=INDEX_DIR, metadatas=None):
+    index_path = os.path.join(index_dir, corpus_fingerprint(texts, model_name, metadatas))
+    if os.path.exists(os.path.join(index_path, MANIFEST_FILE)):
+        return _load_index(index_path, embeddings)
+    return _build_index(texts, embeddings, model_name, index_path, metadatas)
+
+
+# Delete the on-disk indexes of the given fingerprints (ones a reload replaced). Indexes of other corpora
+# and embedding models sharing index_dir are never touched.
+def remove_indexes(fingerprints, index_dir=INDEX_DIR):
+    removed = 0
+    for fingerprint in fingerprints:
+        index_path = os.path.join(index_dir, fingerprint)
+        if os.path.isdir(index_path):
+            shutil.rmtree(index_path, ignore_errors=True)
+            removed += 1
+    return removed
@@ -0,0 +1,96 @@
+import zipfile
+from collections import namedtuple
+from xml.etree import ElementTree
+
+from swot_analyzer.config import MAX_INPUT_BYTES, MAX_INPUT_PAGES
+
+# Text pulled from an uploaded document, how many pages/paragraphs were read, and whether a budget cut it short
+ExtractionResult = namedtuple("ExtractionResult", ["text", "units_read", "truncated"])
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+# Accumulates text pieces until the byte budget is spent
+class _TextBudget:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.used = 0
+        self.parts = []
+
+    # Add a piece of text; returns False once the budget is exhausted
+    def add(self, text):
+        encoded = text.encode("utf-8")
+        remaining = self.max_bytes - self.used
+        if len(encoded) > remaining:
+            self.parts.append(encoded[:remaining].decode("utf-8", errors="ignore"))
+            self.used = self.max_bytes
+            return False
+        self.parts.append(text)
+        self.used += len(encoded)
+        return True
+
+    def text(self, separator):
+        return separator.join(part for part in self.parts if part.strip())
+
+
+# Extract text page by page from a PDF file object, stopping at the page or byte budget
+def extract_pdf_text(stream, max_bytes=MAX_INPUT_BYTES, max_pages=MAX_INPUT_PAGES):
+    from PyPDF2 import PdfReader  # Only needed once a PDF is uploaded
+    reader = PdfReader(stream)
+    budget = _TextBudget(max_bytes)
+    pages_read = 0
+    truncated = False
+    for page in reader.pages:
+        if pages_read >= max_pages:
+            truncated = True
+            break
+        pages_read += 1
+        if not budget.add(page.extract_text() or ""):
+            truncated = True
+            break
+    return ExtractionResult(budget.text("\n\n"), pages_read, truncated)
+
+
+# Stream paragraphs out of word/document.xml without loading the whole document tree
+def extract_docx_text(stream, max_bytes=MAX_INPUT_BYTES):
+    budget = _TextBudget(max_bytes)
+    paragraphs_read = 0
+    truncated = False
+    with zipfile.ZipFile(stream) as archive, archive.open("word/document.xml") as xml:
+        for _, element in ElementTree.iterparse(xml, events=("end",)):
+            if element.tag != WORD_NS + "p":
+                continue
+            pieces = []
+            for node in element.iter():
+                if node.tag == WORD_NS + "t":
+                    pieces.append(node.text or "")
+                elif node.tag == WORD_NS + "tab":
+                    pieces.append("\t")
+                elif node.tag == WORD_NS + "br":
+                    pieces.append("\n")
+            element.clear()
+            paragraphs_read += 1
+            if not budget.add("".join(pieces)):
+                truncated = True
+                break
+    return ExtractionResult(budget.text("\n"), paragraphs_read, truncated)
+
+
+# Read a plain-text file object up to the byte budget
+def extract_txt_text(stream, max_bytes=MAX_INPUT_BYTES):
+    data = stream.read(max_bytes + 1)
+    truncated = len(data) > max_bytes
+    text = data[:max_bytes].decode("utf-8", errors="ignore")
+    return ExtractionResult(text, 1, truncated)
+
+
+# Dispatch on the file extension of an uploaded document
+def extract_text(stream, filename, max_bytes=MAX_INPUT_BYTES, max_pages=MAX_INPUT_PAGES):
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension == "pdf":
+        return extract_pdf_text(stream, max_bytes=max_bytes, max_pages=max_pages)
+    if extension == "docx":
+        return extract_docx_text(stream, max_bytes=max_bytes)
+    if extension == "txt":
+        return extract_txt_text(stream, max_bytes=max_bytes)
+    raise ValueError(f"Unsupported file type: .{extension}")
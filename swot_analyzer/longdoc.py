@@ -0,0 +1,177 @@
+import asyncio
+import re
+
+from swot_analyzer.aio import run_on_shared_loop
+from swot_analyzer.config import LONG_DOCUMENT_CHUNK_CHARS, LONG_DOCUMENT_CONCURRENCY
+from swot_analyzer.metrics import timed
+from swot_analyzer.parsing import IncrementalSwotParser
+from swot_analyzer.streaming import stream_prompt_tokens
+from swot_analyzer.structured import JSON_ITEM_FORMAT
+
+# Map step: pull candidate items out of one excerpt of a long document
+MAP_PROMPT_TEMPLATE = """
+    You are an expert business analyst. The text below is excerpt {index} of {total} from a longer document about an organization.
+
+    Extract candidate SWOT items that this excerpt supports. Use the headings STRENGTHS, WEAKNESSES, OPPORTUNITIES and THREATS, with at most 4 bullet points under each. Each bullet is a short title followed by one sentence citing the evidence in the excerpt. Leave a heading empty if the excerpt has nothing relevant for it.
+
+    Excerpt:
+    {excerpt}
+    """
+
+# Reduce step: consolidate the candidates into the usual final analysis
+REDUCE_PROMPT_TEMPLATE = """
+    You are an expert business analyst specializing in conducting comprehensive SWOT analyses.
+
+    Use the following retrieved context information to enhance your analysis:
+    {context}
+
+    The candidate items below were extracted independently from sections of a long document about the organization, so many of them overlap:
+    {candidates}
+
+    Consolidate them into one final SWOT analysis. Merge duplicates, drop weakly supported items, and rank the remaining items by strategic impact.
+
+    Your analysis must include:
+    1. STRENGTHS: The 6-8 most significant internal capabilities, resources, and advantages.
+
+    2. WEAKNESSES: The 6-8 most critical internal limitations and challenges.
+
+    3. OPPORTUNITIES: The 6-8 most promising external possibilities that could be capitalized upon.
+
+    4. THREATS: The 6-8 most substantial external challenges that could negatively impact the organization.
+
+    For each item, provide 2-3 sentences of explanation that includes specific examples and potential impact. Format your response in markdown with clear headings for each SWOT component. Use bullet points for each item.
+    """
+
+# Reduce step for the structured output mode: the same consolidation, answered as JSON
+JSON_REDUCE_PROMPT_TEMPLATE = """
+    You are an expert business analyst specializing in conducting comprehensive SWOT analyses.
+
+    Use the following retrieved context information to enhance your analysis:
+    {context}
+
+    The candidate items below were extracted independently from sections of a long document about the organization, so many of them overlap:
+    {candidates}
+
+    Consolidate them into one final SWOT analysis. Merge duplicates, drop weakly supported items, and rank the remaining items by strategic impact. Keep the 6-8 most significant items for each of strengths (internal capabilities and advantages), weaknesses (internal limitations), opportunities (external possibilities) and threats (external challenges).
+
+    Respond with only a JSON object, without markdown fences or commentary, in exactly this shape:
+    {{"strengths": [ITEM, ...], "weaknesses": [ITEM, ...], "opportunities": [ITEM, ...], "threats": [ITEM, ...]}}
+    where each ITEM is
+""" + JSON_ITEM_FORMAT
+
+_BULLET_PREFIX = re.compile(r"^(?:[-*•]|\d+[.)])\s*")
+
+
+# Split text into chunks of roughly chunk_chars, preferring paragraph boundaries
+def chunk_text(text, chunk_chars=LONG_DOCUMENT_CHUNK_CHARS):
+    chunks = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        while len(paragraph) > chunk_chars:
+            # Hard-split oversized paragraphs at the last whitespace before the limit
+            cut = paragraph.rfind(" ", 0, chunk_chars)
+            cut = cut if cut > 0 else chunk_chars
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(paragraph[:cut])
+            paragraph = paragraph[cut:].strip()
+        if not paragraph:
+            continue
+        if current and len(current) + len(paragraph) + 2 > chunk_chars:
+            chunks.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# Merge per-chunk candidate lists, dropping items that repeat after normalization
+def collect_candidates(map_outputs):
+    candidates = {}
+    seen = set()
+    for output in map_outputs:
+        parser = IncrementalSwotParser()
+        parser.feed(output)
+        parser.close()
+        for section, items in parser.sections.items():
+            for item in items:
+                text = _BULLET_PREFIX.sub("", item).strip()
+                key = (section, " ".join(text.replace("*", "").lower().split()))
+                if key in seen:
+                    continue
+                seen.add(key)
+                candidates.setdefault(section, []).append(text)
+    return candidates
+
+
+def format_candidates(candidates):
+    blocks = []
+    for section, items in candidates.items():
+        blocks.append(f"{section.upper()} candidates:\n" + "\n".join(f"- {item}" for item in items))
+    return "\n\n".join(blocks)
+
+
+async def _amap_chunks(llm, chunks, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def extract(index, excerpt):
+        async with semaphore:
+            prompt = MAP_PROMPT_TEMPLATE.format(index=index, total=len(chunks), excerpt=excerpt)
+            message = await llm.ainvoke(prompt)
+            return message.content
+
+    return await asyncio.gather(*(extract(index, excerpt) for index, excerpt in enumerate(chunks, start=1)))
+
+
+def _reduce_prompt(qa_chain, chunks, map_outputs, template=REDUCE_PROMPT_TEMPLATE):
+    # Retrieve SWOT concepts for the opening of the document rather than embedding all of it
+    docs = qa_chain.retriever.get_relevant_documents(chunks[0])
+    with timed("prompt_assembly"):
+        context = "\n\n".join(doc.page_content for doc in docs)
+        candidates = format_candidates(collect_candidates(map_outputs))
+        return template.format(context=context, candidates=candidates)
+
+
+# Run the map step over a long document and return the reduce prompt built from its candidates
+def long_document_reduce_prompt(org_info, qa_chain, template=REDUCE_PROMPT_TEMPLATE, concurrency=LONG_DOCUMENT_CONCURRENCY):
+    chunks = chunk_text(org_info)
+    map_outputs = run_on_shared_loop(_amap_chunks(qa_chain.combine_documents_chain.llm_chain.llm, chunks, concurrency))
+    return _reduce_prompt(qa_chain, chunks, map_outputs, template)
+
+
+# Analyze a long document: extract candidates from chunks in parallel, then consolidate them in one short call
+def analyze_long_document(org_info, qa_chain, on_token=None, tracker=None, concurrency=LONG_DOCUMENT_CONCURRENCY):
+    llm = qa_chain.combine_documents_chain.llm_chain.llm
+    prompt = long_document_reduce_prompt(org_info, qa_chain, concurrency=concurrency)
+    if tracker is not None:
+        tracker.mark("retrieval")
+
+    if on_token is None:
+        response = llm.invoke(prompt).content
+        if tracker is not None:
+            tracker.mark("llm_complete")
+        return response
+
+    parts = []
+    for chunk in stream_prompt_tokens(llm, prompt, tracker=tracker):
+        parts.append(chunk)
+        on_token(chunk)
+    return "".join(parts)
+
+
+# Async variant of analyze_long_document
+async def aanalyze_long_document(org_info, qa_chain, tracker=None, concurrency=LONG_DOCUMENT_CONCURRENCY):
+    llm = qa_chain.combine_documents_chain.llm_chain.llm
+    chunks = chunk_text(org_info)
+    map_outputs = await _amap_chunks(llm, chunks, concurrency)
+    prompt = await asyncio.to_thread(_reduce_prompt, qa_chain, chunks, map_outputs)
+    if tracker is not None:
+        tracker.mark("retrieval")
+    message = await llm.ainvoke(prompt)
+    if tracker is not None:
+        tracker.mark("llm_complete")
+    return message.content
@@ -0,0 +1,155 @@
+import json
+import logging
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from swot_analyzer.config import METRICS_TRACE_PATH, METRICS_WINDOW
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95)
+
+
+# Rough token count (about 4 characters per token) for backends that don't report usage
+def estimate_tokens(text):
+    return (len(text) + 3) // 4
+
+
+def _percentile(sorted_samples, quantile):
+    if not sorted_samples:
+        return 0.0
+    return sorted_samples[min(len(sorted_samples) - 1, int(quantile * len(sorted_samples)))]
+
+
+def _labels(labels):
+    return ",".join(f'{name}="{value}"' for name, value in sorted(labels.items()))
+
+
+# Process-wide stage timings (recent window for percentiles, lifetime count/sum) and labelled counters,
+# optionally mirrored to a JSONL trace file
+class MetricsRegistry:
+    def __init__(self, window=METRICS_WINDOW, trace_path=METRICS_TRACE_PATH):
+        self.trace_path = trace_path
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._counts = Counter()
+        self._sums = Counter()
+        self._errors = Counter()
+        self._counters = Counter()
+        self._lock = threading.Lock()
+
+    def _trace(self, event):
+        if not self.trace_path:
+            return
+        event["ts"] = round(time.time(), 6)
+        line = json.dumps(event) + "\n"
+        try:
+            with open(self.trace_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError:
+            logger.exception("Could not write metrics trace to %s", self.trace_path)
+
+    # Record one run of a stage
+    def observe(self, stage, seconds, error=False):
+        with self._lock:
+            self._samples[stage].append(seconds)
+            self._counts[stage] += 1
+            self._sums[stage] += seconds
+            if error:
+                self._errors[stage] += 1
+            self._trace({"type": "stage", "stage": stage, "seconds": round(seconds, 6), "error": error})
+
+    # Add to a counter such as tokens{kind="prompt"} or cache_requests{cache="response",result="hit"}
+    def increment(self, name, amount=1, **labels):
+        with self._lock:
+            self._counters[(name, tuple(sorted(labels.items())))] += amount
+            self._trace({"type": "counter", "name": name, "amount": amount, **labels})
+
+    # Per-stage rows (count, p50, p95, errors) for the admin panel
+    def stage_summary(self):
+        with self._lock:
+            rows = []
+            for stage in sorted(self._counts):
+                samples = sorted(self._samples[stage])
+                rows.append({
+                    "stage": stage,
+                    "count": self._counts[stage],
+                    "p50_s": round(_percentile(samples, 0.5), 3),
+                    "p95_s": round(_percentile(samples, 0.95), 3),
+                    "errors": self._errors[stage],
+                })
+            return rows
+
+    def counters(self):
+        with self._lock:
+            return {(name, labels): value for (name, labels), value in self._counters.items()}
+
+    # Prometheus text exposition format (quantiles cover the recent window, count/sum the process lifetime)
+    def render_prometheus(self):
+        with self._lock:
+            lines = [
+                "# HELP swot_stage_seconds Duration of SWOT pipeline stages.",
+                "# TYPE swot_stage_seconds summary",
+            ]
+            for stage in sorted(self._counts):
+                samples = sorted(self._samples[stage])
+                for quantile in QUANTILES:
+                    labels = _labels({"stage": stage, "quantile": quantile})
+                    lines.append(f"swot_stage_seconds{{{labels}}} {_percentile(samples, quantile):.6f}")
+                lines.append(f'swot_stage_seconds_sum{{stage="{stage}"}} {self._sums[stage]:.6f}')
+                lines.append(f'swot_stage_seconds_count{{stage="{stage}"}} {self._counts[stage]}')
+            lines.append("# HELP swot_stage_errors_total Stage runs that raised an error.")
+            lines.append("# TYPE swot_stage_errors_total counter")
+            for stage in sorted(self._counts):
+                lines.append(f'swot_stage_errors_total{{stage="{stage}"}} {self._errors[stage]}')
+            declared = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in declared:
+                    lines.append(f"# TYPE swot_{name}_total counter")
+                    declared.add(name)
+                label_text = f"{{{_labels(dict(labels))}}}" if labels else ""
+                lines.append(f"swot_{name}_total{label_text} {value}")
+            return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
+
+
+# Time the enclosed block as one run of stage; exceptions are counted as errors and re-raised
+@contextmanager
+def timed(stage, registry=METRICS):
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        registry.observe(stage, time.perf_counter() - started, error=True)
+        raise
+    registry.observe(stage, time.perf_counter() - started)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry = METRICS
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes would otherwise flood stderr
+
+
+# Serve /metrics for Prometheus on a daemon thread; returns the server (call shutdown() to stop it)
+def start_metrics_server(port, host="0.0.0.0"):
+    server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info("Serving metrics on http://%s:%d/metrics", host, port)
+    return server
@@ -0,0 +1,110 @@
+import re
+
+# Section keys in the order their headers take precedence when a line mentions several
+SECTION_ORDER = ("strengths", "weaknesses", "opportunities", "threats")
+
+# Continuation lines folded into a bullet after it (the original 5-line look-ahead window)
+MAX_CONTINUATION_LINES = 4
+
+# Lookahead so overlapping header words on one line are all found
+_HEADER_PATTERN = re.compile(r"(?=(STRENGTHS|WEAKNESSES|OPPORTUNITIES|THREATS))")
+_BULLET_PATTERN = re.compile(r"[-*] |•")
+_NUMBERED_SUFFIXES = (". ", ") ")
+
+
+def is_bullet(line):
+    # str.isdigit (not \d) keeps the historical behaviour for every Unicode digit
+    return bool(_BULLET_PATTERN.match(line)) or (
+        len(line) > 1 and line[0].isdigit() and line[1:3] in _NUMBERED_SUFFIXES
+    )
+
+
+# Section named by a header line, or None; STRENGTHS wins over WEAKNESSES and so on
+def section_for(line):
+    found = _HEADER_PATTERN.findall(line.upper())
+    if not found:
+        return None
+    return min((header.lower() for header in found), key=SECTION_ORDER.index)
+
+
+# Single-pass state machine turning SWOT markdown into section item lists; accepts text in chunks
+class IncrementalSwotParser:
+    def __init__(self):
+        self.sections = {section: [] for section in SECTION_ORDER}
+        self.current_section = None
+        self._buffer = ""
+        self._open_bullet = False
+        self._lines_since_bullet = 0
+
+    # Feed a chunk of text; returns True when any section gained or extended an item
+    def feed(self, chunk):
+        lines = (self._buffer + chunk).split("\n")
+        self._buffer = lines.pop()
+        changed = False
+        for line in lines:
+            changed = self._consume(line.strip()) or changed
+        return changed
+
+    # Flush the trailing partial line once the text is complete
+    def close(self):
+        line, self._buffer = self._buffer, ""
+        return self._consume(line.strip())
+
+    def _consume(self, line):
+        section = section_for(line)
+        if section:
+            self.current_section = section
+            self._open_bullet = False
+            return False
+
+        if not self.current_section or not line:
+            self._lines_since_bullet += 1
+            return False
+
+        if is_bullet(line):
+            self.sections[self.current_section].append(line)
+            self._open_bullet = True
+            self._lines_since_bullet = 0
+            return True
+
+        self._lines_since_bullet += 1
+        if self._open_bullet and self._lines_since_bullet <= MAX_CONTINUATION_LINES and line != '---':
+            self.sections[self.current_section][-1] += " " + line
+            return True
+        return False
+
+
+# Fallback when no bullet sits under a header line: scan the span between header words instead
+def _fallback_sections(analysis_text, sections):
+    upper_text = analysis_text.upper()
+    positions = {section: upper_text.find(section.upper()) for section in SECTION_ORDER}
+    for section in SECTION_ORDER:
+        section_start = positions[section]
+        if section_start == -1:
+            continue
+        next_sections = [positions[other] for other in SECTION_ORDER[1:] if positions[other] > section_start]
+        section_end = min(next_sections) if next_sections else len(analysis_text)
+        for line in analysis_text[section_start:section_end].split('\n'):
+            line = line.strip()
+            if is_bullet(line):
+                sections[section].append(line)
+
+
+# Function to extract SWOT components from analysis text
+def extract_swot_components(analysis_text):
+    parser = IncrementalSwotParser()
+    parser.feed(analysis_text)
+    parser.close()
+    sections = parser.sections
+
+    # Fallback: If no components were extracted, try to extract at least something
+    if all(len(items) == 0 for items in sections.values()):
+        _fallback_sections(analysis_text, sections)
+
+    # If still empty, create placeholders to avoid zero values in charts
+    for section_name in sections:
+        if not sections[section_name]:
+            for i in range(1, 7):  # Add 6 placeholder items
+                sections[section_name].append(f"- {section_name.title()} {i}")
+
+    return sections
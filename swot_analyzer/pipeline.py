@@ -0,0 +1,245 @@
+import asyncio
+import os
+
+from langchain.chains import RetrievalQA
+from langchain.prompts import PromptTemplate
+
+from swot_analyzer.aio import run_on_shared_loop
+from swot_analyzer.backends import create_chat_model, create_embeddings, embedding_model_name
+from swot_analyzer.cache import make_cache_key
+from swot_analyzer.callbacks import MetricsCallbackHandler, StageCallbackHandler
+from swot_analyzer.config import (
+    EMBEDDING_CACHE_DIR,
+    FAST_MAX_PROMPT_CHARS,
+    FAST_MODEL,
+    LLM_BACKEND,
+    LONG_DOCUMENT_CHARS,
+    LONG_DOCUMENT_CHUNK_CHARS,
+    MODEL_ROUTING,
+    OUTPUT_MODE,
+    QUADRANT_GENERATION,
+    RESPONSE_CACHE_TTL,
+)
+from swot_analyzer.embeddings import CachedEmbeddings, EmbeddingStore
+from swot_analyzer.longdoc import (
+    JSON_REDUCE_PROMPT_TEMPLATE,
+    MAP_PROMPT_TEMPLATE,
+    REDUCE_PROMPT_TEMPLATE,
+    aanalyze_long_document,
+    analyze_long_document,
+    chunk_text,
+    long_document_reduce_prompt,
+)
+from swot_analyzer.quadrants import (
+    JSON_QUADRANT_PROMPT_TEMPLATE,
+    QUADRANT_PROMPT_TEMPLATE,
+    agenerate_quadrant_analysis,
+    agenerate_structured_quadrants,
+    generate_quadrant_analysis,
+)
+from swot_analyzer.retrieval import build_category_retriever
+from swot_analyzer.quality import current_quality
+from swot_analyzer.routing import Route, RoutingChatModel
+from swot_analyzer.semantic_cache import SemanticCache
+from swot_analyzer.streaming import stream_chain_tokens
+from swot_analyzer.structured import JSON_PROMPT_TEMPLATE, StructuredOutputError, parse_structured_swot
+
+# Custom prompt template for SWOT analysis
+SWOT_PROMPT_TEMPLATE = """
+    You are an expert business analyst specializing in conducting comprehensive SWOT analyses.
+    
+    Use the following retrieved context information to enhance your analysis:
+    {context}
+    
+    Based on the organizational information provided by the user, conduct a detailed and insightful SWOT analysis for:
+    {question}
+    
+    Your analysis must include:
+    1. STRENGTHS: Identify 6-8 significant internal capabilities, resources, and advantages. Be specific about technological advantages, workforce strengths, operational efficiencies, and strategic assets.
+    
+    2. WEAKNESSES: Identify 6-8 critical internal limitations and challenges. Be detailed about organizational barriers, resource constraints, process inefficiencies, and capability gaps.
+    
+    3. OPPORTUNITIES: Analyze 6-8 promising external possibilities that could be capitalized upon. Identify market openings, technological trends, partnership possibilities, and emerging customer needs.
+    
+    4. THREATS: Identify 6-8 substantial external challenges that could negatively impact the organization. Cover competitive pressures, industry disruptions, regulatory changes, and environmental factors.
+    
+    For each item, provide 2-3 sentences of explanation that includes specific examples and potential impact. Format your response in markdown with clear headings for each SWOT component. Use bullet points for each item.
+    
+    Be creative, insightful, and specific. Avoid generic statements. Your analysis should provide actionable insights that could genuinely help the organization's strategic planning.
+    """
+
+# Gemini model settings (also part of the response cache key)
+LLM_MODEL = "gemini-1.5-pro-latest"
+LLM_TEMPERATURE = 0.7  # Increased temperature for more creative responses
+
+# Model identity for cache keys and batch records, so fake-backend output never mixes with real responses
+MODEL_ID = LLM_MODEL if LLM_BACKEND == "google" else f"fake/{LLM_MODEL}"
+
+# Chat model for the chain: a router over the fast and full models, or Gemini Pro alone with SWOT_ROUTING=0
+def create_llm(callbacks=None):
+    if not MODEL_ROUTING:
+        return create_chat_model(LLM_MODEL, LLM_TEMPERATURE, max_tokens=2000, callbacks=callbacks)
+    routes = [
+        Route("fast", create_chat_model(FAST_MODEL, LLM_TEMPERATURE, max_tokens=2000), max_prompt_chars=FAST_MAX_PROMPT_CHARS),
+        Route("full", create_chat_model(LLM_MODEL, LLM_TEMPERATURE, max_tokens=2000)),
+    ]
+    return RoutingChatModel(routes=routes, callbacks=callbacks)
+
+# Initialize the RAG components
+def initialize_rag():
+    # Repeat queries (and corpus rebuilds) are served from the on-disk embedding cache
+    embedding_model = embedding_model_name()
+    embeddings = CachedEmbeddings(
+        create_embeddings(),
+        EmbeddingStore(os.path.join(EMBEDDING_CACHE_DIR, embedding_model.replace("/", "_"))),
+        embedding_model
+    )
+    # Reuse the persisted partitions unless the corpus (SWOT_CORPUS_PATH) or embedding model changed
+    retriever = build_category_retriever(embeddings, embedding_model)
+    
+    PROMPT = PromptTemplate(
+        template=JSON_PROMPT_TEMPLATE if OUTPUT_MODE == "json" else SWOT_PROMPT_TEMPLATE, 
+        input_variables=["context", "question"]
+    )
+    
+    llm = create_llm(callbacks=[MetricsCallbackHandler()])
+    
+    qa_chain = RetrievalQA.from_chain_type(
+        llm=llm, 
+        chain_type="stuff",
+        retriever=retriever,
+        chain_type_kwargs={"prompt": PROMPT}
+    )
+    
+    return qa_chain
+
+# Near-duplicate cache over the chain's own (cached) query embeddings, so a miss costs no extra embedding call
+def create_semantic_cache(qa_chain):
+    return SemanticCache(qa_chain.retriever.corpus_index.embeddings, ttl_seconds=RESPONSE_CACHE_TTL)
+
+# Model part of cache keys: with routing, the models that may answer and the quality requested
+def _model_key():
+    return f"{MODEL_ID}+{FAST_MODEL}|{current_quality()}" if MODEL_ROUTING else MODEL_ID
+
+# Prompts (and, for map-reduce, the chunk size) that produce a long document's analysis
+def _long_document_template(reduce_template=REDUCE_PROMPT_TEMPLATE):
+    return f"{MAP_PROMPT_TEMPLATE}\x00{reduce_template}\x00{LONG_DOCUMENT_CHUNK_CHARS}"
+
+# Response cache key for the markdown generation path in use
+def _response_cache_key(org_info):
+    if len(org_info) > LONG_DOCUMENT_CHARS:
+        template = _long_document_template()
+    else:
+        template = QUADRANT_PROMPT_TEMPLATE if QUADRANT_GENERATION else SWOT_PROMPT_TEMPLATE
+    return make_cache_key(org_info, template, _model_key(), LLM_TEMPERATURE)
+
+# Cached markdown analysis for org_info, if any (lets callers skip scheduling work that costs no LLM call)
+def cached_swot_analysis(org_info, cache):
+    return cache.get(_response_cache_key(org_info)) if cache is not None else None
+
+# Store an analysis generated without a cache (after a cached_swot_analysis miss) under the same key
+def store_swot_analysis(org_info, cache, response):
+    if cache is not None:
+        cache.set(_response_cache_key(org_info), response)
+
+# LLM requests one analysis of org_info makes in either output mode, for rate limiting (structured mode
+# retries are not counted)
+def estimate_llm_requests(org_info):
+    if len(org_info) > LONG_DOCUMENT_CHARS:
+        return len(chunk_text(org_info)) + 1  # One extraction per chunk plus the consolidation pass
+    if QUADRANT_GENERATION:
+        return 4
+    return 1
+
+# Function to generate SWOT analysis (streams chunks to on_token and reports stages to tracker when given)
+def generate_swot_analysis(org_info, qa_chain, cache=None, on_token=None, tracker=None):
+    if cache is not None:
+        key = _response_cache_key(org_info)
+        response = cache.get(key)
+        if response is not None:
+            if tracker is not None:
+                tracker.mark("llm_complete")
+            return response
+    
+    if len(org_info) > LONG_DOCUMENT_CHARS:
+        response = analyze_long_document(org_info, qa_chain, on_token=on_token, tracker=tracker)
+    elif QUADRANT_GENERATION:
+        response = generate_quadrant_analysis(org_info, qa_chain, tracker=tracker)
+    elif on_token is None:
+        callbacks = [StageCallbackHandler(tracker)] if tracker is not None else None
+        response = qa_chain.run(org_info, callbacks=callbacks)
+    else:
+        chunks = []
+        for chunk in stream_chain_tokens(qa_chain, org_info, tracker=tracker):
+            chunks.append(chunk)
+            on_token(chunk)
+        response = "".join(chunks)
+    
+    if cache is not None:
+        cache.set(key, response)
+    return response
+
+# Async variant of generate_swot_analysis built on the chain's async API
+async def agenerate_swot_analysis(org_info, qa_chain, cache=None, tracker=None):
+    if cache is not None:
+        key = _response_cache_key(org_info)
+        # Cache lookups may touch SQLite, so keep them off the event loop
+        response = await asyncio.to_thread(cache.get, key)
+        if response is not None:
+            if tracker is not None:
+                tracker.mark("llm_complete")
+            return response
+    
+    if len(org_info) > LONG_DOCUMENT_CHARS:
+        response = await aanalyze_long_document(org_info, qa_chain, tracker=tracker)
+    elif QUADRANT_GENERATION:
+        response = await agenerate_quadrant_analysis(org_info, qa_chain, tracker=tracker)
+    else:
+        callbacks = [StageCallbackHandler(tracker)] if tracker is not None else None
+        response = await qa_chain.arun(org_info, callbacks=callbacks)
+    
+    if cache is not None:
+        await asyncio.to_thread(cache.set, key, response)
+    return response
+
+# Structured output mode: returns validated {section: [{title, explanation, impact, likelihood}]} data.
+# Long documents and per-quadrant generation take the same routes as in markdown mode, answered as JSON.
+def generate_structured_swot(org_info, qa_chain, cache=None, tracker=None, retries=1):
+    long_document = len(org_info) > LONG_DOCUMENT_CHARS
+    if long_document:
+        template = _long_document_template(JSON_REDUCE_PROMPT_TEMPLATE)
+    else:
+        template = JSON_QUADRANT_PROMPT_TEMPLATE if QUADRANT_GENERATION else JSON_PROMPT_TEMPLATE
+    key = make_cache_key(org_info, template, _model_key(), LLM_TEMPERATURE)
+    if cache is not None:
+        response = cache.get(key)
+        if response is not None:
+            if tracker is not None:
+                tracker.mark("llm_complete")
+            return parse_structured_swot(response)
+    
+    callbacks = [StageCallbackHandler(tracker)] if tracker is not None else None
+    if long_document:
+        # The map step runs once; a malformed answer only repeats the JSON reduce call
+        llm = qa_chain.combine_documents_chain.llm_chain.llm
+        prompt = long_document_reduce_prompt(org_info, qa_chain, JSON_REDUCE_PROMPT_TEMPLATE)
+        if tracker is not None:
+            tracker.mark("retrieval")
+        ask = lambda: llm.invoke(prompt, config={"callbacks": callbacks}).content
+    elif QUADRANT_GENERATION:
+        ask = lambda: run_on_shared_loop(agenerate_structured_quadrants(org_info, qa_chain))
+    else:
+        ask = lambda: qa_chain.run(org_info, callbacks=callbacks)
+    for attempt in range(retries + 1):
+        try:
+            response = ask()
+            swot = parse_structured_swot(response)
+        except StructuredOutputError:
+            if attempt == retries:
+                raise
+            continue
+        if tracker is not None:
+            tracker.mark("llm_complete")
+        if cache is not None:
+            cache.set(key, response)
+        return swot
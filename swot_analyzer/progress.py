@@ -0,0 +1,49 @@
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages in order: (name, progress label, percent complete)
+PIPELINE_STAGES = [
+    ("retrieval", "Retrieved relevant SWOT concepts", 15),
+    ("first_token", "Receiving analysis from Gemini...", 30),
+    ("llm_complete", "Analysis generated", 80),
+    ("parsing", "Extracted SWOT components", 90),
+    ("charts", "Built visualizations", 100),
+]
+
+
+# Record wall-clock timings for each pipeline stage and report progress as stages complete
+class StageTracker:
+    def __init__(self, on_stage=None):
+        self.on_stage = on_stage
+        self.started = time.perf_counter()
+        self.timings = {}
+        self._last = self.started
+
+    # Mark a stage as done; repeated or out-of-order marks for earlier stages are ignored
+    def mark(self, stage):
+        if stage in self.timings:
+            return
+        names = [name for name, _, _ in PIPELINE_STAGES]
+        if any(name in self.timings for name in names[names.index(stage) + 1:]):
+            return
+
+        now = time.perf_counter()
+        self.timings[stage] = now - self._last
+        self._last = now
+        _, label, percent = PIPELINE_STAGES[names.index(stage)]
+        if self.on_stage is not None:
+            self.on_stage(stage, label, percent)
+
+    def total(self):
+        return self._last - self.started
+
+    # Human-readable "stage: seconds" summary in pipeline order
+    def summary(self):
+        parts = [f"{name} {self.timings[name]:.2f}s" for name, _, _ in PIPELINE_STAGES if name in self.timings]
+        parts.append(f"total {self.total():.2f}s")
+        return " · ".join(parts)
+
+    def log(self):
+        logger.info("SWOT pipeline timings: %s", self.summary())
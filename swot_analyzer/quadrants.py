@@ -0,0 +1,88 @@
+import asyncio
+import json
+
+from swot_analyzer.aio import run_on_shared_loop
+from swot_analyzer.metrics import timed
+from swot_analyzer.parsing import SECTION_ORDER
+from swot_analyzer.structured import JSON_ITEM_FORMAT, load_json_response
+
+# One smaller prompt per SWOT quadrant, run concurrently
+QUADRANT_PROMPT_TEMPLATE = """
+    You are an expert business analyst specializing in conducting comprehensive SWOT analyses.
+
+    Use the following retrieved context information to enhance your analysis:
+    {context}
+
+    Based on the organizational information provided by the user, analyze only the {section} of:
+    {question}
+
+    {brief}
+
+    For each item, provide 2-3 sentences of explanation that includes specific examples and potential impact. Respond with markdown bullet points only, one per item, without any heading or introduction.
+
+    Be creative, insightful, and specific. Avoid generic statements.
+    """
+
+# Structured output mode: one quadrant as a JSON array of items
+JSON_QUADRANT_PROMPT_TEMPLATE = """
+    You are an expert business analyst specializing in conducting comprehensive SWOT analyses.
+
+    Use the following retrieved context information to enhance your analysis:
+    {context}
+
+    Based on the organizational information provided by the user, analyze only the {section} of:
+    {question}
+
+    {brief}
+
+    Respond with only a JSON array, without markdown fences or commentary, with one ITEM per item, where each ITEM is
+""" + JSON_ITEM_FORMAT + """
+    Be creative, insightful, and specific. Avoid generic statements.
+    """
+
+# Per-quadrant instructions (taken from the single-call prompt)
+QUADRANT_BRIEFS = {
+    "strengths": "Identify 6-8 significant internal capabilities, resources, and advantages. Be specific about technological advantages, workforce strengths, operational efficiencies, and strategic assets.",
+    "weaknesses": "Identify 6-8 critical internal limitations and challenges. Be detailed about organizational barriers, resource constraints, process inefficiencies, and capability gaps.",
+    "opportunities": "Analyze 6-8 promising external possibilities that could be capitalized upon. Identify market openings, technological trends, partnership possibilities, and emerging customer needs.",
+    "threats": "Identify 6-8 substantial external challenges that could negatively impact the organization. Cover competitive pressures, industry disruptions, regulatory changes, and environmental factors.",
+}
+
+
+async def _agenerate_quadrant(section, org_info, qa_chain, template=QUADRANT_PROMPT_TEMPLATE):
+    # Only this quadrant's concept partition (plus methodology) goes into the prompt
+    retriever = qa_chain.retriever.with_categories(section, "methodology")
+    docs = await retriever.aget_relevant_documents(org_info)
+    with timed("prompt_assembly"):
+        prompt = template.format(
+            context="\n\n".join(doc.page_content for doc in docs),
+            section=section.upper(),
+            question=org_info,
+            brief=QUADRANT_BRIEFS[section],
+        )
+    message = await qa_chain.combine_documents_chain.llm_chain.llm.ainvoke(prompt)
+    return message.content.strip()
+
+
+# Generate all four quadrants concurrently and merge them into one markdown analysis
+async def agenerate_quadrant_analysis(org_info, qa_chain, tracker=None):
+    bodies = await asyncio.gather(*(_agenerate_quadrant(section, org_info, qa_chain) for section in SECTION_ORDER))
+    if tracker is not None:
+        tracker.mark("llm_complete")
+    return "\n\n".join(f"## {section.upper()}\n\n{body}" for section, body in zip(SECTION_ORDER, bodies)) + "\n"
+
+
+# Blocking wrapper; the tracker is marked from the caller's thread, not the event loop's
+def generate_quadrant_analysis(org_info, qa_chain, tracker=None):
+    response = run_on_shared_loop(agenerate_quadrant_analysis(org_info, qa_chain))
+    if tracker is not None:
+        tracker.mark("llm_complete")
+    return response
+
+
+# Structured output mode: the four quadrants' JSON arrays as one JSON object, ready for parse_structured_swot
+async def agenerate_structured_quadrants(org_info, qa_chain):
+    bodies = await asyncio.gather(*(
+        _agenerate_quadrant(section, org_info, qa_chain, JSON_QUADRANT_PROMPT_TEMPLATE) for section in SECTION_ORDER
+    ))
+    return json.dumps({section: load_json_response(body) for section, body in zip(SECTION_ORDER, bodies)})
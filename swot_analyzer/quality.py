@@ -0,0 +1,23 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# "auto" routes on prompt size and route health, "fast" prefers the cheapest model, "high" the best one
+QUALITY_LEVELS = ("auto", "fast", "high")
+
+# Quality requested for LLM calls made in the current context (asyncio tasks and to_thread calls inherit it)
+_requested_quality = ContextVar("swot_requested_quality", default="auto")
+
+
+@contextmanager
+def requested_quality(level):
+    if level not in QUALITY_LEVELS:
+        raise ValueError(f"Unknown quality {level!r}; expected one of {', '.join(QUALITY_LEVELS)}")
+    token = _requested_quality.set(level)
+    try:
+        yield
+    finally:
+        _requested_quality.reset(token)
+
+
+def current_quality():
+    return _requested_quality.get()
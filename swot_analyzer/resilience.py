@@ -0,0 +1,305 @@
+import asyncio
+import logging
+import queue
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from langchain.chat_models.base import BaseChatModel
+
+from swot_analyzer.aio import run_on_shared_loop
+from swot_analyzer.config import (
+    BREAKER_FAILURES,
+    BREAKER_RESET_SECONDS,
+    LLM_DEADLINE,
+    LLM_HEDGE_QUANTILE,
+    LLM_MAX_RETRIES,
+    LLM_RETRY_BACKOFF,
+    LLM_TIMEOUT,
+)
+from swot_analyzer.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# Exception class names (google.api_core and common HTTP clients) for errors worth retrying
+TRANSIENT_ERRORS = {
+    "ResourceExhausted", "ServiceUnavailable", "InternalServerError", "DeadlineExceeded",
+    "Aborted", "TooManyRequests", "BadGateway", "GatewayTimeout",
+}
+
+# Successful calls observed before hedging starts, so the latency percentile means something
+HEDGE_MIN_SAMPLES = 20
+
+
+class LLMTimeoutError(TimeoutError):
+    pass
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+def is_transient(exc):
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    return any(cls.__name__ in TRANSIENT_ERRORS for cls in type(exc).__mro__)
+
+
+# Fails calls fast once failure_threshold requests in a row fail with transient errors (0 disables it);
+# a request counts once, after its retries. After reset_seconds one probe request is let through:
+# success closes the circuit, failure re-opens it.
+class CircuitBreaker:
+    def __init__(self, name="llm", failure_threshold=BREAKER_FAILURES, reset_seconds=BREAKER_RESET_SECONDS):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half_open" if time.monotonic() - self._opened_at >= self.reset_seconds else "open"
+
+    # Raise CircuitOpenError unless a call may go to the backend now
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._probing:
+                METRICS.increment("llm_circuit_rejections", circuit=self.name)
+                raise CircuitOpenError(f"{self.name} backend is failing; retry in {max(remaining, 0):.0f}s")
+            self._probing = True
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit %s closed", self.name)
+            self.failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failure_threshold and (self._probing or self.failures >= self.failure_threshold):
+                if self._opened_at is None or self._probing:
+                    logger.warning("Circuit %s opened after %d failures", self.name, self.failures)
+                    METRICS.increment("llm_circuit_opened", circuit=self.name)
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    # A request that ended without an outcome (cancelled, or its stream abandoned) frees the probe slot
+    def release(self):
+        with self._lock:
+            self._probing = False
+
+
+# Recent successful call latencies, for picking the hedging delay
+class LatencyWindow:
+    def __init__(self, size=200):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    # Latency at quantile, or None until HEDGE_MIN_SAMPLES calls have been seen
+    def percentile(self, quantile):
+        with self._lock:
+            if len(self._samples) < HEDGE_MIN_SAMPLES:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(quantile * len(samples)))]
+
+
+_STREAM_END = object()
+
+
+# Drain a blocking chunk iterator on a worker thread, so the consumer can time out waiting on it
+def _pump_stream(iterator, chunks, stop):
+    try:
+        for chunk in iterator:
+            if stop.is_set():
+                break
+            chunks.put((chunk, None))
+        chunks.put((_STREAM_END, None))
+    except BaseException as exc:
+        chunks.put((_STREAM_END, exc))
+    finally:
+        iterator.close()
+
+
+# Chat model wrapper that bounds tail latency: every attempt has a timeout and all attempts share one
+# deadline, transient errors are retried with jittered exponential backoff, a circuit breaker fails fast
+# while the backend is down, and (with hedge_quantile set) a non-streaming call still running after that
+# latency percentile gets a duplicate request, whichever answers first wins.
+# Streaming calls are only retried until the first chunk; the timeout then applies between chunks, and the
+# deadline to the whole stream.
+class ResilientChatModel(BaseChatModel):
+    llm: BaseChatModel
+    timeout: float = LLM_TIMEOUT
+    deadline: float = LLM_DEADLINE
+    max_retries: int = LLM_MAX_RETRIES
+    backoff: float = LLM_RETRY_BACKOFF
+    hedge_quantile: float = LLM_HEDGE_QUANTILE
+    breaker: Optional[CircuitBreaker] = None
+    latencies: Optional[LatencyWindow] = None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.breaker is None:
+            self.breaker = CircuitBreaker(name=getattr(self.llm, "model", None) or self.llm._llm_type)
+        if self.latencies is None:
+            self.latencies = LatencyWindow()
+
+    @property
+    def _llm_type(self):
+        return self.llm._llm_type
+
+    @property
+    def _identifying_params(self):
+        return self.llm._identifying_params
+
+    # Backoff before retrying a failed attempt, or None to give up
+    def _retry_delay(self, exc, attempt, give_up_at):
+        if not is_transient(exc):
+            return None
+        delay = random.uniform(0, self.backoff * 2 ** attempt)
+        if attempt >= self.max_retries or time.monotonic() + delay >= give_up_at:
+            return None
+        METRICS.increment("llm_retries", error=type(exc).__name__)
+        logger.warning("LLM call failed (%s); retrying in %.1fs", exc, delay)
+        return delay
+
+    # Tell the breaker how a request ended once it gives up
+    def _record_error(self, exc):
+        if is_transient(exc):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()  # The backend answered; the request itself was bad
+
+    def _attempt_timeout(self, give_up_at):
+        remaining = give_up_at - time.monotonic()
+        if remaining <= 0:
+            raise LLMTimeoutError(f"LLM call exceeded its {self.deadline:.0f}s deadline")
+        return min(self.timeout, remaining)
+
+    # One attempt, plus a hedged duplicate once it runs past the latency percentile; first success wins
+    async def _hedged_generate(self, messages, stop, **kwargs):
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self.llm._agenerate(messages, stop=stop, **kwargs))
+        tasks = [primary]
+        try:
+            hedge_after = self.latencies.percentile(self.hedge_quantile) if self.hedge_quantile else None
+            if hedge_after is not None:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done:
+                    METRICS.increment("llm_hedges", result="sent")
+                    tasks.append(asyncio.ensure_future(self.llm._agenerate(messages, stop=stop, **kwargs)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            METRICS.increment("llm_hedges", result="won")
+                        self.latencies.add(time.monotonic() - started)
+                        return task.result()
+            return primary.result()  # Every request failed: raise the primary's error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.breaker.allow()
+        give_up_at = time.monotonic() + self.deadline
+        try:
+            for attempt in range(self.max_retries + 1):
+                timeout = self._attempt_timeout(give_up_at)
+                try:
+                    try:
+                        result = await asyncio.wait_for(self._hedged_generate(messages, stop, **kwargs), timeout)
+                    except asyncio.TimeoutError as exc:
+                        raise LLMTimeoutError(f"LLM call timed out after {timeout:.3g}s") from exc
+                except Exception as exc:
+                    delay = self._retry_delay(exc, attempt, give_up_at)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+                break
+        except Exception as exc:
+            self._record_error(exc)
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
+        return result
+
+    # Blocking calls run the async path on the shared loop, so timeouts and hedging behave the same
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        return run_on_shared_loop(self._agenerate(messages, stop=stop, **kwargs))
+
+    # Chunks of one streaming attempt; raises LLMTimeoutError when the next chunk takes longer than the
+    # timeout or the stream runs past give_up_at
+    def _stream_attempt(self, messages, stop, give_up_at, **kwargs):
+        chunks, stop_event = queue.Queue(), threading.Event()
+        iterator = self.llm._stream(messages, stop=stop, **kwargs)
+        threading.Thread(target=_pump_stream, args=(iterator, chunks, stop_event), name="llm-stream", daemon=True).start()
+        try:
+            while True:
+                timeout = self._attempt_timeout(give_up_at)
+                try:
+                    chunk, error = chunks.get(timeout=timeout)
+                except queue.Empty:
+                    if timeout < self.timeout:
+                        raise LLMTimeoutError(f"LLM call exceeded its {self.deadline:.0f}s deadline") from None
+                    raise LLMTimeoutError(f"No output from the LLM for {timeout:.3g}s") from None
+                if error is not None:
+                    raise error
+                if chunk is _STREAM_END:
+                    return
+                yield chunk
+        finally:
+            stop_event.set()
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.breaker.allow()
+        give_up_at = time.monotonic() + self.deadline
+        try:
+            for attempt in range(self.max_retries + 1):
+                emitted = False
+                try:
+                    for chunk in self._stream_attempt(messages, stop, give_up_at, **kwargs):
+                        emitted = True
+                        # Token callbacks fire here, on the caller's thread, not on the worker draining the stream
+                        if run_manager is not None:
+                            run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                        yield chunk
+                except Exception as exc:
+                    delay = self._retry_delay(exc, attempt, give_up_at)
+                    if delay is None or emitted:
+                        raise
+                    time.sleep(delay)
+                    continue
+                break
+        except Exception as exc:
+            self._record_error(exc)
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+        self.breaker.record_success()
@@ -0,0 +1,142 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from langchain.schema import BaseRetriever
+
+from swot_analyzer.config import CATEGORY_K, CORPUS_PATH, CORPUS_POLL_SECONDS, INDEX_DIR, RETRIEVAL_K
+from swot_analyzer.corpus import corpus_signature, load_corpus
+from swot_analyzer.index import corpus_fingerprint, load_or_build_index, remove_indexes
+from swot_analyzer.metrics import timed
+
+logger = logging.getLogger(__name__)
+
+
+# One memory-mapped FAISS partition per corpus category, rebuilt in the background when the corpus changes
+class CorpusIndex:
+    def __init__(self, embeddings, model_name, path=CORPUS_PATH, poll_seconds=CORPUS_POLL_SECONDS, index_dir=INDEX_DIR):
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.path = path
+        self.index_dir = index_dir
+        self.poll_seconds = poll_seconds
+        self._stores = {}  # Partition fingerprint -> FAISS store, so unchanged categories are reused
+        self._lock = threading.Lock()
+        self._reloading = False
+        self.signature = corpus_signature(path)
+        self.partitions = self._build(load_corpus(path))
+        self._next_check = time.monotonic() + poll_seconds
+
+    def _build(self, corpus):
+        partitions, stores = {}, {}
+        for category, texts in corpus.items():
+            metadatas = [{"category": category}] * len(texts)
+            fingerprint = corpus_fingerprint(texts, self.model_name, metadatas)
+            store = self._stores.get(fingerprint)
+            if store is None:
+                # Only new or changed passages reach the embedding model; the rest come from the embedding cache
+                store = load_or_build_index(texts, self.embeddings, self.model_name, self.index_dir, metadatas)
+            partitions[category] = stores[fingerprint] = store
+        self._stores = stores
+        return partitions
+
+    # Delete the on-disk indexes of partitions a reload replaced; searches still holding an old store keep
+    # reading it through the memory map, which outlives the deleted file
+    def _remove_replaced(self, fingerprints):
+        try:
+            removed = remove_indexes(fingerprints, self.index_dir)
+        except OSError:
+            logger.exception("Could not remove replaced corpus indexes")
+            return
+        if removed:
+            logger.info("Removed %d replaced corpus index(es)", removed)
+
+    # Current {category: store}; at most every poll_seconds, checks the corpus and starts a rebuild if it changed
+    def current(self):
+        if self.poll_seconds > 0 and time.monotonic() >= self._next_check:
+            self._maybe_reload()
+        return self.partitions
+
+    def _maybe_reload(self):
+        with self._lock:
+            if self._reloading or time.monotonic() < self._next_check:
+                return
+            self._next_check = time.monotonic() + self.poll_seconds
+            try:
+                signature = corpus_signature(self.path)
+            except OSError:
+                logger.exception("Could not check corpus %s for changes", self.path)
+                return
+            if signature == self.signature:
+                return
+            self._reloading = True
+        threading.Thread(target=self._reload, args=(signature,), name="corpus-reload", daemon=True).start()
+
+    def _reload(self, signature):
+        try:
+            started = time.perf_counter()
+            previous = set(self._stores)
+            partitions = self._build(load_corpus(self.path))
+            # Searches already running keep the old partitions; new ones see the new dict
+            self.partitions, self.signature = partitions, signature
+            logger.info("Reloaded corpus %s (%d passages) in %.1fs", self.path,
+                        sum(store.index.ntotal for store in partitions.values()), time.perf_counter() - started)
+            self._remove_replaced(previous - set(self._stores))
+        except Exception:
+            logger.exception("Corpus reload failed; keeping the current index")
+        finally:
+            self._reloading = False
+
+
+# Retriever over a CorpusIndex.
+# Unfiltered searches merge the partitions' best matches into the global top k;
+# filtered searches only touch the named partitions and take each category's own k.
+class CategoryRetriever(BaseRetriever):
+    corpus_index: CorpusIndex
+    k: int = RETRIEVAL_K
+    categories: Optional[Tuple[str, ...]] = None
+    category_k: Dict[str, int] = {}
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    # Copy of this retriever restricted to the given categories (per-category k from CATEGORY_K unless overridden)
+    def with_categories(self, *categories, **category_k):
+        return self.copy(update={"categories": categories, "category_k": {**self.category_k, **category_k}})
+
+    def _k_for(self, category):
+        return self.category_k.get(category, CATEGORY_K.get(category, CATEGORY_K["default"]))
+
+    def _search(self, query):
+        partitions = self.corpus_index.current()
+        # Embed the query once for all partitions
+        embedding = self.corpus_index.embeddings.embed_query(query)
+        with timed("vector_search"):
+            if self.categories is None:
+                scored = [hit for store in partitions.values()
+                          for hit in store.similarity_search_with_score_by_vector(embedding, k=self.k)]
+                scored.sort(key=lambda hit: hit[1])
+                return [doc for doc, _ in scored[:self.k]]
+
+            scored = []
+            for category in self.categories:
+                # A custom corpus need not have every category
+                k = self._k_for(category)
+                if k > 0 and category in partitions:
+                    scored.extend(partitions[category].similarity_search_with_score_by_vector(embedding, k=k))
+            scored.sort(key=lambda hit: hit[1])
+            return [doc for doc, _ in scored]
+
+    def _get_relevant_documents(self, query, *, run_manager=None):
+        return self._search(query)
+
+    async def _aget_relevant_documents(self, query, *, run_manager=None):
+        # FAISS search and query embedding are blocking, so keep them off the event loop
+        return await asyncio.to_thread(self._search, query)
+
+
+# Build (or load) the corpus partitions and a retriever that follows later corpus changes
+def build_category_retriever(embeddings, model_name, path=CORPUS_PATH, k=RETRIEVAL_K):
+    return CategoryRetriever(corpus_index=CorpusIndex(embeddings, model_name, path), k=k)
@@ -0,0 +1,130 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import List
+
+from langchain.chat_models.base import BaseChatModel
+
+from swot_analyzer.config import ROUTE_MAX_ERROR_RATE, ROUTE_MAX_P95_SECONDS
+from swot_analyzer.metrics import METRICS
+from swot_analyzer.quality import current_quality
+
+logger = logging.getLogger(__name__)
+
+# Calls a route needs in its window before its error rate and latency are trusted
+ROUTE_MIN_SAMPLES = 5
+
+# Outcomes older than this are forgotten, so a route skipped as degraded gets tried again later
+ROUTE_WINDOW_SECONDS = 300
+
+
+# One configured chat model. Routes are listed cheapest first; max_prompt_chars (None for no limit)
+# is the largest prompt the route takes under "auto".
+class Route:
+    def __init__(self, name, llm, max_prompt_chars=None, window=50):
+        self.name = name
+        self.llm = llm
+        self.max_prompt_chars = max_prompt_chars
+        self._outcomes = deque(maxlen=window)  # (finished at, seconds, failed) for recent calls
+        self._lock = threading.Lock()
+
+    def record(self, seconds, failed=False):
+        with self._lock:
+            self._outcomes.append((time.monotonic(), seconds, failed))
+        METRICS.observe(f"route_{self.name}", seconds, error=failed)
+        METRICS.increment("llm_route_requests", route=self.name, result="error" if failed else "ok")
+
+    def health(self):
+        cutoff = time.monotonic() - ROUTE_WINDOW_SECONDS
+        with self._lock:
+            outcomes = [(seconds, failed) for finished, seconds, failed in self._outcomes if finished >= cutoff]
+        latencies = sorted(seconds for seconds, failed in outcomes if not failed)
+        return {
+            "route": self.name,
+            "calls": len(outcomes),
+            "error_rate": sum(failed for _, failed in outcomes) / len(outcomes) if outcomes else 0.0,
+            "p95_s": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else 0.0,
+        }
+
+    # Whether recent calls stayed within the error rate and latency limits (and the circuit is closed)
+    def healthy(self):
+        breaker = getattr(self.llm, "breaker", None)
+        if breaker is not None and breaker.state == "open":
+            return False
+        health = self.health()
+        if health["calls"] < ROUTE_MIN_SAMPLES:
+            return True
+        return health["error_rate"] <= ROUTE_MAX_ERROR_RATE and health["p95_s"] <= ROUTE_MAX_P95_SECONDS
+
+
+# Chat model that sends each call to one of several routes, chosen by prompt size, the requested
+# quality (see quality.requested_quality) and each route's recent error rate and p95 latency
+class RoutingChatModel(BaseChatModel):
+    routes: List[Route]
+
+    class Config:
+        arbitrary_types_allowed = True
+
+    @property
+    def _llm_type(self):
+        return "swot-router"
+
+    @property
+    def _identifying_params(self):
+        return {"routes": [route.name for route in self.routes]}
+
+    # Routes in order of preference for a prompt of prompt_chars characters
+    def _preference(self, prompt_chars):
+        quality = current_quality()
+        if quality == "high":
+            return self.routes[::-1]
+        if quality == "fast":
+            return list(self.routes)
+        fits = [route for route in self.routes if route.max_prompt_chars is None or prompt_chars <= route.max_prompt_chars]
+        # Smallest route that takes the prompt first, then the bigger ones as fallbacks
+        return fits + [route for route in self.routes[::-1] if route not in fits]
+
+    # Most preferred healthy route; the most preferred one overall if none is healthy
+    def choose(self, messages):
+        preference = self._preference(sum(len(str(message.content)) for message in messages))
+        route = next((route for route in preference if route.healthy()), preference[0])
+        if route is not preference[0]:
+            METRICS.increment("llm_route_fallbacks", route=preference[0].name)
+            logger.info("Route %s is degraded; using %s", preference[0].name, route.name)
+        return route
+
+    def route_health(self):
+        return [route.health() for route in self.routes]
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        route = self.choose(messages)
+        started = time.perf_counter()
+        try:
+            result = route.llm._generate(messages, stop=stop, **kwargs)
+        except Exception:
+            route.record(time.perf_counter() - started, failed=True)
+            raise
+        route.record(time.perf_counter() - started)
+        return result
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        route = self.choose(messages)
+        started = time.perf_counter()
+        try:
+            result = await route.llm._agenerate(messages, stop=stop, **kwargs)
+        except Exception:
+            route.record(time.perf_counter() - started, failed=True)
+            raise
+        route.record(time.perf_counter() - started)
+        return result
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        route = self.choose(messages)
+        started = time.perf_counter()
+        try:
+            yield from route.llm._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+        except Exception:
+            route.record(time.perf_counter() - started, failed=True)
+            raise
+        route.record(time.perf_counter() - started)
@@ -0,0 +1,153 @@
+import itertools
+import math
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from swot_analyzer.config import SCHEDULER_BURST, SCHEDULER_CONCURRENCY, SCHEDULER_RPM
+from swot_analyzer.metrics import METRICS
+
+# Assumed analysis duration for wait estimates until real ones have been observed
+DEFAULT_ANALYSIS_SECONDS = 20.0
+
+
+# Token bucket refilled at rate_per_minute up to burst tokens; one token per LLM request
+class TokenBucket:
+    def __init__(self, rate_per_minute, burst):
+        self.rate = rate_per_minute / 60.0
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    # Seconds until cost tokens are available (0 if they are now); callers hold the scheduler lock.
+    # A request costing more than burst only waits for a full bucket, since it could never hold more.
+    def delay(self, cost):
+        self._refill()
+        missing = min(cost, self.burst) - self._tokens
+        return max(0.0, missing / self.rate) if self.rate else (0.0 if missing <= 0 else math.inf)
+
+    # Charge the full cost; an oversized request leaves the balance negative and later callers wait out the debt
+    def take(self, cost):
+        self._refill()
+        self._tokens -= cost
+
+
+class _Ticket:
+    def __init__(self, session_id, cost, seq, start):
+        self.session_id = session_id
+        self.cost = cost
+        self.seq = seq
+        self.start = start  # Virtual start time: a session's next request starts where its previous one finished
+        self.enqueued = time.monotonic()
+
+
+# Process-wide admission control in front of the LLM: at most max_concurrency analyses run at once,
+# LLM requests are paced by a token bucket sized to the provider quota (requests_per_minute <= 0
+# disables it), and waiting sessions take turns so no session hogs capacity
+class AnalysisScheduler:
+    def __init__(self, max_concurrency=SCHEDULER_CONCURRENCY, requests_per_minute=SCHEDULER_RPM, burst=SCHEDULER_BURST):
+        self.max_concurrency = max_concurrency
+        self.bucket = TokenBucket(requests_per_minute, burst) if requests_per_minute > 0 else None
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._running = Counter()  # Session id -> analyses running
+        self._active = 0
+        self._durations = deque(maxlen=50)
+        self._seq = itertools.count()
+        self._virtual_time = 0  # Start tag of the latest admitted request
+        self._finish = {}  # Session id -> virtual finish time of its latest request
+
+    # Waiting tickets in the order they will be admitted (start-time fair queueing: sessions with a
+    # backlog take turns instead of one session's queued requests all going first)
+    def _queue(self):
+        return sorted(self._waiting, key=lambda ticket: (ticket.start, ticket.seq))
+
+    def _average_duration(self):
+        return sum(self._durations) / len(self._durations) if self._durations else DEFAULT_ANALYSIS_SECONDS
+
+    # Admit ticket if it is next in line and capacity allows; otherwise seconds worth waiting before retrying
+    def _try_admit(self, ticket):
+        if self._active >= self.max_concurrency or self._queue()[0] is not ticket:
+            return None
+        if self.bucket is not None:
+            delay = self.bucket.delay(ticket.cost)
+            if delay > 0:
+                return delay
+            self.bucket.take(ticket.cost)
+        self._waiting.remove(ticket)
+        self._active += 1
+        self._running[ticket.session_id] += 1
+        self._virtual_time = ticket.start
+        # Sessions that are no further ahead than the virtual clock carry no history worth keeping
+        for session_id in [session_id for session_id, finish in self._finish.items() if finish <= self._virtual_time]:
+            del self._finish[session_id]
+        return 0.0
+
+    # 1-based queue position and estimated seconds until ticket is admitted
+    def _estimate(self, ticket):
+        queue = self._queue()
+        position = queue.index(ticket) + 1
+        # With every slot busy, each round of max_concurrency analyses ahead takes about one average duration
+        eta = 0.0
+        if self._active >= self.max_concurrency:
+            eta = math.ceil(position / self.max_concurrency) * self._average_duration()
+        if self.bucket is not None:
+            eta = max(eta, self.bucket.delay(sum(queued.cost for queued in queue[:position])))
+        return position, eta
+
+    # Hold an analysis slot for session_id; cost is the number of LLM requests the analysis makes.
+    # While queued, on_wait(position, eta_seconds) is called every poll_seconds from this thread,
+    # and an exception it raises (e.g. Streamlit stopping a superseded run) leaves the queue.
+    @contextmanager
+    def slot(self, session_id, cost=1, on_wait=None, poll_seconds=0.5):
+        with self._cond:
+            start = max(self._virtual_time, self._finish.get(session_id, 0))
+            self._finish[session_id] = start + 1
+            ticket = _Ticket(session_id, cost, next(self._seq), start)
+            self._waiting.append(ticket)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_admit(ticket)
+                    if wait == 0.0:
+                        break
+                    position, eta = self._estimate(ticket)
+                    self._cond.wait(min(poll_seconds, wait) if wait is not None else poll_seconds)
+                if on_wait is not None:
+                    on_wait(position, eta)
+        except BaseException:
+            with self._cond:
+                self._waiting.remove(ticket)
+                # A request abandoned while queued doesn't count against the session's turn
+                if self._finish.get(session_id) == ticket.start + 1:
+                    self._finish[session_id] = ticket.start
+                self._cond.notify_all()
+            raise
+
+        admitted = time.monotonic()
+        METRICS.observe("queue_wait", admitted - ticket.enqueued)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._running[session_id] -= 1
+                if not self._running[session_id]:
+                    del self._running[session_id]
+                self._durations.append(time.monotonic() - admitted)
+                self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "running": self._active,
+                "waiting": len(self._waiting),
+                "sessions": len({ticket.session_id for ticket in self._waiting} | set(self._running)),
+                "average_seconds": self._average_duration(),
+            }
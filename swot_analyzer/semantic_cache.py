@@ -0,0 +1,97 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+import faiss
+import numpy as np
+
+from swot_analyzer.config import SEMANTIC_CACHE_SIZE, SEMANTIC_CACHE_THRESHOLD
+from swot_analyzer.metrics import METRICS
+
+# How far below the threshold a best match still counts as a near miss in the tuning stats
+NEAR_MISS_MARGIN = 0.02
+
+# A cached analysis served for a near-duplicate input, with the cosine similarity that matched it
+SemanticHit = namedtuple("SemanticHit", ["response", "similarity"])
+
+
+# Result cache keyed by meaning rather than exact text: past inputs' embeddings go into an
+# inner-product FAISS index over unit vectors, so the nearest neighbour's score is its cosine similarity
+class SemanticCache:
+    def __init__(self, embeddings, threshold=SEMANTIC_CACHE_THRESHOLD, max_entries=SEMANTIC_CACHE_SIZE,
+                 ttl_seconds=24 * 3600):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.near_misses = 0
+        self._index = None  # Created on first insert, once the embedding size is known
+        self._entries = OrderedDict()  # FAISS id -> (response, created), oldest first
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    # Unit-length query embedding (served from the embedding cache, which retrieval reuses on a miss)
+    def _vector(self, org_info):
+        vector = np.array(self.embeddings.embed_query(org_info), dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def _expired(self, created):
+        return self.ttl_seconds is not None and time.time() - created > self.ttl_seconds
+
+    def _remove(self, entry_id):
+        del self._entries[entry_id]
+        self._index.remove_ids(np.array([entry_id], dtype=np.int64))
+
+    # Cached analysis of the most similar earlier input, if it is within the threshold
+    def get(self, org_info):
+        vector = self._vector(org_info)
+        with self._lock:
+            similarity, response = -1.0, None
+            if self._index is not None and self._index.ntotal:
+                scores, ids = self._index.search(vector, 1)
+                entry_id = int(ids[0][0])
+                if entry_id in self._entries:
+                    cached, created = self._entries[entry_id]
+                    if self._expired(created):
+                        self._remove(entry_id)
+                    else:
+                        similarity, response = float(scores[0][0]), cached
+
+            if response is not None and similarity >= self.threshold:
+                self.hits += 1
+                METRICS.increment("cache_requests", cache="semantic", result="hit")
+                return SemanticHit(response, similarity)
+
+            self.misses += 1
+            if similarity >= self.threshold - NEAR_MISS_MARGIN:
+                self.near_misses += 1
+            METRICS.increment("cache_requests", cache="semantic", result="miss")
+            return None
+
+    def set(self, org_info, response):
+        vector = self._vector(org_info)
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexIDMap2(faiss.IndexFlatIP(vector.shape[1]))
+            entry_id = self._next_id
+            self._next_id += 1
+            self._index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+            self._entries[entry_id] = (response, time.time())
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    # Hit rate and near misses (best match just under the threshold) for tuning the threshold
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "threshold": self.threshold,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "near_misses": self.near_misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,24 @@
+from swot_analyzer.metrics import timed
+
+
+# Yield answer chunks for a RetrievalQA "stuff" chain as the LLM streams them
+def stream_chain_tokens(qa_chain, question, tracker=None):
+    docs = qa_chain.retriever.get_relevant_documents(question)
+    if tracker is not None:
+        tracker.mark("retrieval")
+    llm_chain = qa_chain.combine_documents_chain.llm_chain
+    with timed("prompt_assembly"):
+        context = "\n\n".join(doc.page_content for doc in docs)
+        prompt = llm_chain.prompt.format(context=context, question=question)
+    yield from stream_prompt_tokens(llm_chain.llm, prompt, tracker=tracker)
+
+
+# Yield chunks of the LLM's answer to an already formatted prompt
+def stream_prompt_tokens(llm, prompt, tracker=None):
+    for chunk in llm.stream(prompt):
+        if chunk.content:
+            if tracker is not None:
+                tracker.mark("first_token")
+            yield chunk.content
+    if tracker is not None:
+        tracker.mark("llm_complete")
@@ -0,0 +1,86 @@
+import json
+import re
+
+from swot_analyzer.parsing import SECTION_ORDER
+
+LEVELS = ("High", "Medium", "Low")
+ITEM_FIELDS = ("title", "explanation", "impact", "likelihood")
+
+# One item in the structured prompts' answer format (braces doubled for str.format)
+JSON_ITEM_FORMAT = """    {{"title": "short item title", "explanation": "2-3 sentences with specific examples and potential impact", "impact": "High" | "Medium" | "Low", "likelihood": "High" | "Medium" | "Low"}}
+"""
+
+# Prompt for the structured output mode: same analysis brief, JSON instead of markdown
+JSON_PROMPT_TEMPLATE = """
+    You are an expert business analyst specializing in conducting comprehensive SWOT analyses.
+
+    Use the following retrieved context information to enhance your analysis:
+    {context}
+
+    Based on the organizational information provided by the user, conduct a detailed and insightful SWOT analysis for:
+    {question}
+
+    Identify 6-8 items for each of strengths (internal capabilities and advantages), weaknesses (internal limitations), opportunities (external possibilities) and threats (external challenges).
+
+    Respond with only a JSON object, without markdown fences or commentary, in exactly this shape:
+    {{"strengths": [ITEM, ...], "weaknesses": [ITEM, ...], "opportunities": [ITEM, ...], "threats": [ITEM, ...]}}
+    where each ITEM is
+""" + JSON_ITEM_FORMAT + """
+    Be creative, insightful, and specific. Avoid generic statements.
+    """
+
+_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+
+class StructuredOutputError(ValueError):
+    pass
+
+
+# JSON value of a model answer, tolerating markdown fences around it
+def load_json_response(text):
+    try:
+        return json.loads(_FENCE.sub("", text))
+    except ValueError as exc:
+        raise StructuredOutputError(f"Response is not valid JSON: {exc}") from exc
+
+
+# Parse and validate the model's JSON answer into {section: [item, ...]}
+def parse_structured_swot(text):
+    data = load_json_response(text)
+    if not isinstance(data, dict):
+        raise StructuredOutputError("Response must be a JSON object")
+
+    swot = {}
+    for section in SECTION_ORDER:
+        items = data.get(section)
+        if not isinstance(items, list) or not items:
+            raise StructuredOutputError(f"'{section}' must be a non-empty list")
+        swot[section] = []
+        for position, item in enumerate(items, start=1):
+            if not isinstance(item, dict) or not all(isinstance(item.get(field), str) for field in ITEM_FIELDS):
+                raise StructuredOutputError(f"{section}[{position}] must have string fields {', '.join(ITEM_FIELDS)}")
+            clean = {field: item[field].strip() for field in ITEM_FIELDS}
+            for field in ("impact", "likelihood"):
+                clean[field] = clean[field].title()
+                if clean[field] not in LEVELS:
+                    raise StructuredOutputError(f"{section}[{position}].{field} must be one of {', '.join(LEVELS)}")
+            swot[section].append(clean)
+    return swot
+
+
+def _bullet(item):
+    return (f"- **{item['title']}:** {item['explanation']} "
+            f"*(Impact: {item['impact']} · Likelihood: {item['likelihood']})*")
+
+
+# Render validated SWOT data as the markdown shown in the Detailed Analysis tab
+def render_swot_markdown(swot):
+    blocks = []
+    for section in SECTION_ORDER:
+        blocks.append(f"## {section.upper()}\n\n" + "\n".join(_bullet(item) for item in swot[section]))
+    return "\n\n".join(blocks) + "\n"
+
+
+# The extract_swot_components structure, built directly from the validated data
+def swot_components_from_structured(swot):
+    return {section: [_bullet(item) for item in swot[section]] for section in SECTION_ORDER}
@@ -0,0 +1 @@
+# Streamlit UI pieces for the SWOT Analysis app (static assets and result renderers)
@@ -0,0 +1,12 @@
+import functools
+import os
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+
+
+# Contents of a static asset, read once per process (optionally wrapped in a tag, e.g. "style")
+@functools.lru_cache(maxsize=None)
+def load_asset(name, wrap=None):
+    with open(os.path.join(STATIC_DIR, name), encoding="utf-8") as f:
+        content = f.read()
+    return f"<{wrap}>\n{content}</{wrap}>\n" if wrap else content
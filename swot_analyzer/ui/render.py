@@ -0,0 +1,60 @@
+import streamlit as st
+
+
+# Function to render the SWOT overview grid
+def render_swot_overview(swot_components):
+    # Display SWOT grid with components
+    st.markdown("## SWOT Analysis Overview")
+    
+    # Create a 2x2 grid for SWOT components
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Strengths
+        st.markdown("<div class='result-card strengths'>", unsafe_allow_html=True)
+        st.markdown("### 💪 Strengths")
+        if swot_components["strengths"]:
+            for item in swot_components["strengths"][:3]:  # Show only top 3 for overview
+                st.markdown(f"{item}")
+            if len(swot_components["strengths"]) > 3:
+                st.markdown(f"*...and {len(swot_components['strengths']) - 3} more*")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Opportunities
+        st.markdown("<div class='result-card opportunities'>", unsafe_allow_html=True)
+        st.markdown("### 🚀 Opportunities")
+        if swot_components["opportunities"]:
+            for item in swot_components["opportunities"][:3]:  # Show only top 3 for overview
+                st.markdown(f"{item}")
+            if len(swot_components["opportunities"]) > 3:
+                st.markdown(f"*...and {len(swot_components['opportunities']) - 3} more*")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+    with col2:
+        # Weaknesses
+        st.markdown("<div class='result-card weaknesses'>", unsafe_allow_html=True)
+        st.markdown("### 🔍 Weaknesses")
+        if swot_components["weaknesses"]:
+            for item in swot_components["weaknesses"][:3]:  # Show only top 3 for overview
+                st.markdown(f"{item}")
+            if len(swot_components["weaknesses"]) > 3:
+                st.markdown(f"*...and {len(swot_components['weaknesses']) - 3} more*")
+        st.markdown("</div>", unsafe_allow_html=True)
+        
+        # Threats
+        st.markdown("<div class='result-card threats'>", unsafe_allow_html=True)
+        st.markdown("### ⚠️ Threats")
+        if swot_components["threats"]:
+            for item in swot_components["threats"][:3]:  # Show only top 3 for overview
+                st.markdown(f"{item}")
+            if len(swot_components["threats"]) > 3:
+                st.markdown(f"*...and {len(swot_components['threats']) - 3} more*")
+        st.markdown("</div>", unsafe_allow_html=True)
+
+
+# Function to render the full SWOT analysis text
+def render_detailed_analysis(analysis_text):
+    st.markdown("## Complete SWOT Analysis")
+    st.markdown("<div class='result-card'>", unsafe_allow_html=True)
+    st.markdown(analysis_text)
+    st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,50 @@
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from swot_analyzer.cache import normalize_text
+from swot_analyzer.metrics import METRICS
+
+
+# Per-session trigger policy: only an explicit request starts an analysis, and repeating it for an
+# input that was already analyzed is a no-op. Text edits alone never reach the LLM.
+class AnalysisTrigger:
+    def __init__(self):
+        self._key = None  # Normalized input of the latest started analysis
+        self._completed = False
+
+    # Whether this script run should start an analysis of org_info (options, such as the quality
+    # level, are part of what makes two requests the same)
+    def should_run(self, org_info, requested, *options):
+        if not requested or not org_info.strip():
+            return False
+        key = (normalize_text(org_info), options)
+        if key == self._key and self._completed:
+            METRICS.increment("analysis_triggers", result="debounced")
+            return False
+        # A started run that never completed was superseded (the user clicked again), so start over
+        self._key, self._completed = key, False
+        METRICS.increment("analysis_triggers", result="started")
+        return True
+
+    def mark_completed(self):
+        self._completed = True
+
+    # Whether the input differs from what the displayed analysis was generated for
+    def is_stale(self, org_info):
+        return self._key is not None and normalize_text(org_info) != self._key[0]
+
+
+# Wait for a shared-loop future while giving Streamlit a chance to interrupt the script.
+# heartbeat() must touch a Streamlit element (clearing an empty placeholder will do, so nothing
+# visible changes): that is where a superseding rerun stops this run, and the generation is then
+# cancelled instead of running on for a result nobody will see.
+def wait_cancellable(future, heartbeat, poll_seconds=0.25):
+    try:
+        while True:
+            try:
+                return future.result(timeout=poll_seconds)
+            except FutureTimeoutError:
+                heartbeat()
+    finally:
+        if not future.done():
+            future.cancel()
+            METRICS.increment("analysis_triggers", result="cancelled")
@@ -0,0 +1,62 @@
+# Resume checks for batch runs: ids read from the input are the checkpoint keys in the output file,
+# so rows must keep distinct ids across runs, including rows whose id cell is blank.
+import csv
+import json
+
+import pytest
+
+pytest.importorskip("langchain")
+
+from swot_analyzer import batch  # noqa: E402
+
+ANALYSIS = "## Strengths\n- Loyal customers\n\n## Weaknesses\n- Thin margins\n"
+
+
+# Stands in for the RetrievalQA chain; records the inputs it was asked to analyze
+class FakeChain:
+    def __init__(self):
+        self.inputs = []
+
+    def run(self, org_info, callbacks=None):
+        self.inputs.append(org_info)
+        return ANALYSIS
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["id", "org_info"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@pytest.fixture(autouse=True)
+def markdown_mode(monkeypatch):
+    monkeypatch.setattr(batch, "OUTPUT_MODE", "markdown")
+
+
+def test_blank_ids_fall_back_to_row_numbers(tmp_path):
+    path = tmp_path / "orgs.csv"
+    write_csv(path, [{"id": "", "org_info": "A"}, {"id": " ", "org_info": "B"}, {"id": "0", "org_info": "C"}])
+    assert batch.read_organizations(str(path)) == [("1", "A"), ("2", "B"), ("0", "C")]
+
+
+def test_duplicate_ids_are_rejected(tmp_path):
+    path = tmp_path / "orgs.csv"
+    write_csv(path, [{"id": "acme", "org_info": "A"}, {"id": "acme", "org_info": "B"}])
+    with pytest.raises(ValueError, match="acme"):
+        batch.read_organizations(str(path))
+
+
+def test_resume_with_blank_ids_runs_every_row(tmp_path):
+    input_path, output_path = tmp_path / "orgs.csv", tmp_path / "results.jsonl"
+    write_csv(input_path, [{"id": "", "org_info": "A"}, {"id": "", "org_info": "B"}, {"id": "", "org_info": "C"}])
+    # A previous run finished the first row before it was interrupted
+    output_path.write_text(json.dumps({"id": "1", "analysis": ANALYSIS}) + "\n", encoding="utf-8")
+
+    chain = FakeChain()
+    summary = batch.run_batch(str(input_path), str(output_path), concurrency=1, qa_chain=chain)
+
+    assert summary == {"succeeded": 2, "failed": 0, "skipped": 1}
+    assert sorted(chain.inputs) == ["B", "C"]
+    with open(output_path, encoding="utf-8") as f:
+        assert sorted(json.loads(line)["id"] for line in f) == ["1", "2", "3"]
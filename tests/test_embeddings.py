@@ -0,0 +1,57 @@
+# Crash recovery of the on-disk embedding store: a write cut off in either file must not keep the
+# store from opening, and the entries written before it must stay readable.
+import numpy as np
+
+from swot_analyzer.embeddings import KEYS_FILE, VECTORS_FILE, EmbeddingStore
+
+DIM = 3
+
+
+def vector(value):
+    return np.full(DIM, value, dtype=np.float32)
+
+
+def test_reopens_after_cut_off_key_line(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many([("aaaa", vector(1)), ("bbbb", vector(2))])
+    # A crash while writing the entry for a third vector leaves half a line in the key index
+    with open(tmp_path / VECTORS_FILE, "ab") as f:
+        f.write(vector(3).tobytes())
+    with open(tmp_path / KEYS_FILE, "ab") as f:
+        f.write(b"cc")
+
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many([("dddd", vector(4))])
+
+    store = EmbeddingStore(str(tmp_path))
+    assert store.get("cc") is None
+    for key, value in (("aaaa", 1), ("bbbb", 2), ("dddd", 4)):
+        np.testing.assert_array_equal(store.get(key), vector(value))
+
+
+def test_skips_merged_key_lines(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many([("aaaa", vector(1))])
+    # Written by a version that appended onto a cut-off line
+    with open(tmp_path / KEYS_FILE, "ab") as f:
+        f.write(b"bbbb 1cccc 1\n")
+
+    store = EmbeddingStore(str(tmp_path))
+    assert store.get("bbbb") is None and store.get("cccc") is None
+    np.testing.assert_array_equal(store.get("aaaa"), vector(1))
+    store.put_many([("eeee", vector(5))])
+    np.testing.assert_array_equal(EmbeddingStore(str(tmp_path)).get("eeee"), vector(5))
+
+
+def test_drops_cut_off_vector_row(tmp_path):
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many([("aaaa", vector(1))])
+    with open(tmp_path / VECTORS_FILE, "ab") as f:
+        f.write(vector(2).tobytes()[:5])
+
+    store = EmbeddingStore(str(tmp_path))
+    store.put_many([("bbbb", vector(2))])
+
+    store = EmbeddingStore(str(tmp_path))
+    np.testing.assert_array_equal(store.get("aaaa"), vector(1))
+    np.testing.assert_array_equal(store.get("bbbb"), vector(2))
@@ -0,0 +1,40 @@
+# Hot reloads of the corpus index: the partitions a reload replaces are deleted from disk, while indexes
+# built for other corpora or embedding models in the same directory are kept.
+import json
+import os
+
+from swot_analyzer.fakes import HashingEmbeddings
+from swot_analyzer.index import corpus_fingerprint
+from swot_analyzer.retrieval import CorpusIndex
+
+
+def write_corpus(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for category, text in records:
+            f.write(json.dumps({"category": category, "text": text}) + "\n")
+
+
+def index_dirs(index_dir):
+    return {name for name in os.listdir(index_dir) if not name.startswith(".")}
+
+
+def fingerprint(model_name, category, texts):
+    return corpus_fingerprint(texts, model_name, [{"category": category}] * len(texts))
+
+
+def test_reload_removes_only_replaced_partitions(tmp_path):
+    corpus_path, index_dir = str(tmp_path / "corpus.jsonl"), str(tmp_path / "index")
+    write_corpus(corpus_path, [("strengths", "Loyal customers"), ("threats", "New competitors")])
+    embeddings = HashingEmbeddings(dim=16)
+    CorpusIndex(embeddings, "other-model", corpus_path, poll_seconds=0, index_dir=index_dir)
+    corpus_index = CorpusIndex(embeddings, "model", corpus_path, poll_seconds=0, index_dir=index_dir)
+    before = index_dirs(index_dir)
+    assert len(before) == 4
+
+    write_corpus(corpus_path, [("strengths", "Loyal customers"), ("threats", "Rising costs")])
+    corpus_index._reload("changed")
+
+    assert index_dirs(index_dir) == (before - {fingerprint("model", "threats", ["New competitors"])}) | {
+        fingerprint("model", "threats", ["Rising costs"])
+    }
+    assert corpus_index.partitions["threats"].docstore.search("0").page_content == "Rising costs"
@@ -0,0 +1,49 @@
+# Golden-file checks for the SWOT markdown parser. Each tests/golden/<case>.md holds model output and
+# <case>.json the components the original line-scanning parser produced for it, so the rewritten
+# single-pass parser must reproduce them exactly, whether it gets the text at once or streamed in chunks.
+import json
+from pathlib import Path
+
+import pytest
+
+from swot_analyzer.parsing import IncrementalSwotParser, extract_swot_components
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+CASES = sorted(path.stem for path in GOLDEN_DIR.glob("*.md"))
+
+# Chunk sizes for the streaming checks: single characters, odd splits inside words and lines, whole lines
+CHUNK_SIZES = (1, 3, 17, 64)
+
+
+def load_case(name):
+    # newline="" keeps \r\n line endings as the model sent them
+    with open(GOLDEN_DIR / f"{name}.md", encoding="utf-8", newline="") as f:
+        text = f.read()
+    expected = json.loads((GOLDEN_DIR / f"{name}.json").read_text(encoding="utf-8"))
+    return text, expected
+
+
+def stream(text, chunk_size):
+    parser = IncrementalSwotParser()
+    for start in range(0, len(text), chunk_size):
+        parser.feed(text[start:start + chunk_size])
+    parser.close()
+    return parser.sections
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_extract_matches_golden(name):
+    text, expected = load_case(name)
+    assert extract_swot_components(text) == expected
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+@pytest.mark.parametrize("name", CASES)
+def test_streamed_chunks_match_golden(name, chunk_size):
+    text, expected = load_case(name)
+    sections = stream(text, chunk_size)
+    assert sections == stream(text, len(text) or 1)
+    # Sections the stream filled are final; empty ones are left to the fallback and placeholders
+    for section, items in sections.items():
+        if items:
+            assert items == expected[section]